@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+DependencyCache - Persistent cache for analyze_dependencies results
+
+<!--TAG:tool_dep_cache-->
+
+PURPOSE:
+    Stores the serialized dependency JSON of each analyzed file in SQLite,
+    keyed by (path, SHA-256 of the source, analysis version); callers fold
+    anything else the payload depends on (e.g. the project root) into the
+    version string.
+    analyze_dependencies.py consults it before parsing, so unchanged files
+    skip AST parse/visit/serialization entirely on re-runs.
+    ast_auto_tagger.py keeps its per-file AST structure in a separate
+    database through the same class.
+
+DEPENDENCIES (Quick Reference):
+    Standard Library:
+        - sqlite3 (cache storage, WAL mode for concurrent pool workers)
+        - hashlib (SHA-256 content keys)
+    Data:
+        - Cache: docs/memory/dependencies/.cache.sqlite
+
+<!--/TAG:tool_dep_cache-->
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+
+class DependencyCache:
+    """
+    SQLite-backed store of dependency JSON payloads.
+
+    Connections are opened lazily, one per thread, and re-opened after a
+    fork, so one instance is safe to share between threads and to use from
+    process pool workers.
+    """
+
+    def __init__(self, db_path: Path, version: str):
+        """
+        Args:
+            db_path: SQLite database file (created on first use)
+            version: Analysis version (plus any other payload inputs);
+                entries from other versions never match
+        """
+        self.db_path = Path(db_path)
+        self.version = version
+        self._local = threading.local()
+
+    @staticmethod
+    def digest(source: bytes) -> str:
+        """SHA-256 hex digest of the raw source (bytes or mmap)."""
+        return hashlib.sha256(source).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open (or re-open after fork) this thread's connection."""
+        local = self._local
+        if getattr(local, 'pid', None) != os.getpid():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            # WAL lets readers run alongside the (serialized) writers
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "path TEXT, sha TEXT, version TEXT, json BLOB, mtime REAL, "
+                "PRIMARY KEY (path, sha, version))"
+            )
+            conn.commit()
+            local.conn = conn
+            local.pid = os.getpid()
+        return local.conn
+
+    def get(self, path: str, sha: str) -> Optional[bytes]:
+        """Return the cached payload for this exact source, or None."""
+        row = self._connect().execute(
+            "SELECT json FROM entries WHERE path = ? AND sha = ? AND version = ?",
+            (path, sha, self.version)
+        ).fetchone()
+        return bytes(row[0]) if row else None
+
+    def put(self, path: str, sha: str, payload: bytes, mtime: float = 0.0):
+        """
+        Store a payload, dropping entries for older contents of the same path.
+        
+        Args:
+            mtime: st_mtime of the source file the payload was built from
+        """
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM entries WHERE path = ? AND sha != ?", (path, sha))
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (path, sha, version, json, mtime) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (path, sha, self.version, payload, mtime)
+            )
+
+    def close(self):
+        """Close this thread's connection (if open)."""
+        local = self._local
+        if getattr(local, 'pid', None) == os.getpid():
+            local.conn.close()
+        local.conn = None
+        local.pid = None
@@ -24,15 +24,19 @@ DOCUMENTATION:
 DEPENDENCIES (Quick Reference):
     Code:
         - docs.utils.docs_logger (isolated paranoid logging)
+        - automation._dep_cache (SQLite cache of per-file results)
     Standard Library:
         - ast (AST parsing)
-        - json (output serialization)
+        - asyncio (--all: subdirectories analyzed concurrently)
+        - json (output serialization; orjson used instead when installed)
         - re (dynamic import detection via regex)
+        - mmap (zero-copy source reads)
         - dataclasses (data structures)
         - pathlib.Path (file path handling)
     Data:
         - Input: *.py files
         - Output: docs/memory/dependencies/*_dependencies.json
+        - Cache: docs/memory/dependencies/.cache.sqlite
 
 RECENT CHANGES:
     2025-12-11: v2.0 - Added decorator args, dynamic imports, metaclass detection
@@ -45,22 +49,40 @@ TAGS: <!--TAG:component:automation--> <!--TAG:type:script--> <!--TAG:feature:ana
 """
 
 import ast
+import bisect
 import json
+import mmap
 import os
 import re
+import sqlite3
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import Dict, List, Set, Any, Optional
-from dataclasses import dataclass, asdict, field
-from collections import defaultdict
+from typing import Dict, List, Set, Tuple, Any, Optional
+from dataclasses import dataclass, field, fields
+from collections import defaultdict, deque
+from contextlib import ExitStack
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 
 # Add project root to path
 # Add project root to Python path for portable imports
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 from utils.docs_logger import DocsLogger
+from automation._dep_cache import DependencyCache
+
+# Optional: orjson serializes in C straight to bytes - graceful fallback to json
+try:
+    import orjson
+    HAS_ORJSON = True
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
 
 # Initialize logger
 logger = DocsLogger("analyze_dependencies")
@@ -68,17 +90,50 @@ logger = DocsLogger("analyze_dependencies")
 # Analysis version
 ANALYSIS_VERSION = "2.0"
 
+# Source files are scanned as raw bytes (mmap), so all module-level
+# patterns are bytes patterns.
+
+# Cheap pre-scan: files without any of these tokens have nothing for the AST
+# visitors, the dynamic import patterns or the main-guard check to extract,
+# so ast.parse() is skipped for them entirely. __import__ and __main__ are
+# listed because neither needs an import statement to appear in a file.
+_INTEREST_RE = re.compile(
+    rb'\b(?:import|class|def|open|subprocess|getenv|environ|argparse|requests|openai|anthropic|Popen'
+    rb'|__import__|__main__)\b'
+)
+
+_NEWLINE_RE = re.compile(rb'\n')
+
+_MAIN_GUARD_RE = re.compile(rb'if\s+__name__\s*==\s*[\'"]__main__[\'"]')
+
+# analyze_directory logs progress once per this many files
+_PROGRESS_INTERVAL = 100
+
+# Directories never scanned for source files
+_SKIP_DIRS = frozenset(('__pycache__', 'vllm-latest', '.git', '.venv', 'node_modules'))
+
+# Cache-miss sentinel (None is a valid cached name)
+_MISSING = object()
+
+# Constant tag values shared by every output dict (one interned object each)
+_ARG = sys.intern('arg')
+_VARARG = sys.intern('vararg')
+_KWARG = sys.intern('kwarg')
+_DYNAMIC_IMPORT = sys.intern('dynamic_import')
+
 
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class DependencyInfo:
     """
     Complete dependency information for a Python file.
     
     v2.0: Added function_definitions, dynamic_imports, resolved_imports, metadata
+    
+    Slotted (no per-instance __dict__) and keyword-only; requires Python 3.10+.
     """
     file_path: str
     
@@ -117,12 +172,61 @@ class DependencyInfo:
     metadata: Dict[str, Any] = field(default_factory=dict)
     analysis_version: str = ANALYSIS_VERSION
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Shallow dict view for JSON output.
+        
+        Unlike dataclasses.asdict() nothing is deep-copied: the field values
+        are already JSON-compatible lists/dicts and are returned by reference.
+        """
+        return {name: getattr(self, name) for name in _DEPENDENCY_FIELDS}
+
+
+_DEPENDENCY_FIELDS = tuple(f.name for f in fields(DependencyInfo))
+
+
+def _serialize(deps: DependencyInfo) -> bytes:
+    """
+    Encode a DependencyInfo as indented UTF-8 JSON.
+    
+    orjson (when available) serializes the dataclass natively, so no
+    intermediate dict is built at all; json gets the shallow to_dict() view.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(deps, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits - let json handle it
+    return json.dumps(deps.to_dict(), indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _write_json(output_file: Path, deps: DependencyInfo):
+    """Serialize deps and write it to output_file in a single write."""
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_bytes(_serialize(deps))
 
 
 # ============================================================================
 # TASK 2.1: Dynamic Import Detector
 # ============================================================================
 
+def _combine_patterns(patterns: Dict[str, bytes], names=None):
+    """
+    Join named patterns into one alternation with a named group per pattern.
+    
+    Returns:
+        (compiled regex, {pattern name: index of that pattern's own capture group})
+    """
+    selected = [(name, regex) for name, regex in patterns.items() if names is None or name in names]
+    combined = re.compile(
+        b'|'.join(b'(?P<%s>%s)' % (name.encode('ascii'), regex) for name, regex in selected),
+        re.MULTILINE
+    )
+    # Each pattern's own capture group directly follows its named group
+    return combined, {name: index + 1 for name, index in combined.groupindex.items()}
+
+
 class DynamicImportDetector:
     """
     Detects dynamic import patterns that AST can't fully resolve.
@@ -133,85 +237,286 @@ class DynamicImportDetector:
     - Conditional imports (if ... import)
     """
     
-    # Regex patterns for dynamic imports
+    # Regex patterns for dynamic imports.
+    # (?<![.\w]) rejects hits on attribute chains / longer identifiers
+    # (foo.importlib..., my__import__); the conditional forms are anchored
+    # at the start of a line, which also rules out commented-out code.
     PATTERNS = {
-        'importlib': r'importlib\.import_module\s*\(\s*["\']([^"\']+)["\']\s*\)',
-        'importlib_var': r'importlib\.import_module\s*\(\s*(\w+)\s*\)',
-        '__import__': r'__import__\s*\(\s*["\']([^"\']+)["\']\s*\)',
-        '__import___var': r'__import__\s*\(\s*(\w+)\s*\)',
-        'exec_import': r'exec\s*\(\s*["\']import\s+(\w+)["\']\s*\)',
-        'conditional_import': r'if\s+[^:]+:\s*\n\s*import\s+(\w+)',
-        'try_import': r'try:\s*\n\s*import\s+(\w+)',
+        'importlib': rb'(?<![.\w])importlib\.import_module\s*\(\s*["\']([^"\']+)["\']\s*\)',
+        'importlib_var': rb'(?<![.\w])importlib\.import_module\s*\(\s*(\w+)\s*\)',
+        '__import__': rb'(?<![.\w])__import__\s*\(\s*["\']([^"\']+)["\']\s*\)',
+        '__import___var': rb'(?<![.\w])__import__\s*\(\s*(\w+)\s*\)',
+        'exec_import': rb'(?<![.\w])exec\s*\(\s*["\']import\s+(\w+)["\']\s*\)',
+        'conditional_import': rb'^[ \t]*if\s+[^:]+:\s*\n\s*import\s+(\w+)',
+        'try_import': rb'^[ \t]*try:\s*\n\s*import\s+(\w+)',
     }
     
-    def detect_dynamic_imports(self, source_code: str, file_path: str) -> List[Dict[str, Any]]:
+    # All patterns as one alternation: a single pass over the source,
+    # the matching pattern is recovered via match.lastgroup
+    _COMBINED, _MODULE_GROUP = _combine_patterns(PATTERNS)
+    
+    # Without any of these tokens the call-style patterns cannot match, and
+    # only the block-style (if/try) alternatives need to be scanned
+    _CALL_TOKENS = (b'importlib', b'__import__', b'exec')
+    _BLOCK_ONLY, _BLOCK_MODULE_GROUP = _combine_patterns(
+        PATTERNS, ('conditional_import', 'try_import')
+    )
+    
+    # With a parsed tree available, only exec("import ...") needs the regex
+    _EXEC_ONLY, _EXEC_MODULE_GROUP = _combine_patterns(PATTERNS, ('exec_import',))
+    
+    # (confidence, warning) per pattern name
+    _CLASSIFICATION = {
+        'importlib': ('high', 'Dynamic import detected - verify manually'),
+        'importlib_var': ('low', 'Dynamic import with variable - cannot resolve statically'),
+        '__import__': ('high', 'Dynamic import detected - verify manually'),
+        '__import___var': ('low', 'Dynamic import with variable - cannot resolve statically'),
+        'exec_import': ('high', 'Dynamic import detected - verify manually'),
+        'conditional_import': ('medium', 'Conditional import - may not always be executed'),
+        'try_import': ('medium', 'Conditional import - may not always be executed'),
+    }
+    
+    # (reported pattern label, is_variable) per pattern name
+    _PATTERN_LABEL = {name: (name.replace('_var', ''), '_var' in name) for name in PATTERNS}
+    
+    def detect_dynamic_imports(self, source_code: bytes, file_path: str,
+                               tree: Optional[ast.AST] = None) -> List[Dict[str, Any]]:
         """
         Detect dynamic imports via regex + heuristics.
         
+        When the already-parsed tree is passed, calls and if/try imports are
+        read from it (see detect_from_ast) and the source is only regex-scanned
+        for exec("import ...") strings, which the AST can't see inside.
+        
         Args:
-            source_code: Python source code as string
+            source_code: Python source code as bytes (or a read-only mmap)
             file_path: Path to the file being analyzed
+            tree: Parsed AST of source_code (optional)
             
         Returns:
-            List of detected dynamic import patterns
+            List of detected dynamic import patterns, in source order
+        """
+        # Every pattern contains 'import' literally. Substring checks use
+        # find() (C-level search) since `in` on an mmap tests single bytes.
+        if source_code.find(b'import') == -1:
+            return []
+        
+        if tree is not None:
+            dynamic_imports = self.detect_from_ast(tree)
+            if source_code.find(b'exec') != -1:
+                dynamic_imports.extend(
+                    self._scan(source_code, self._EXEC_ONLY, self._EXEC_MODULE_GROUP)
+                )
+                dynamic_imports.sort(key=itemgetter('line'))
+            return dynamic_imports
+        
+        if any(source_code.find(token) != -1 for token in self._CALL_TOKENS):
+            return self._scan(source_code, self._COMBINED, self._MODULE_GROUP)
+        return self._scan(source_code, self._BLOCK_ONLY, self._BLOCK_MODULE_GROUP)
+    
+    def detect_from_ast(self, tree: ast.AST) -> List[Dict[str, Any]]:
+        """
+        Detect dynamic imports from a parsed tree in a single walk.
+        
+        Finds importlib.import_module() / __import__() calls (literal vs
+        variable argument) and imports that open an if / try block.
+        Nodes in comments or strings never show up, so no false positives.
+        
+        Args:
+            tree: Parsed AST of the file
+            
+        Returns:
+            List of detected dynamic import patterns, in source order
         """
         dynamic_imports = []
         
-        for pattern_name, regex in self.PATTERNS.items():
-            try:
-                matches = re.finditer(regex, source_code, re.MULTILINE)
-                for match in matches:
-                    # Get module name from capture group
-                    module_name = match.group(1) if match.groups() else 'unknown'
-                    
-                    # Calculate line number
-                    line_num = source_code[:match.start()].count('\n') + 1
-                    
-                    # Determine confidence based on pattern type
-                    if '_var' in pattern_name:
-                        confidence = 'low'  # Variable - can't know the value
-                        warning = 'Dynamic import with variable - cannot resolve statically'
-                    elif 'conditional' in pattern_name or 'try' in pattern_name:
-                        confidence = 'medium'  # Conditional - may or may not execute
-                        warning = 'Conditional import - may not always be executed'
-                    else:
-                        confidence = 'high'  # Literal string - we know the module
-                        warning = 'Dynamic import detected - verify manually'
-                    
-                    dynamic_imports.append({
-                        'type': 'dynamic_import',
-                        'pattern': pattern_name.replace('_var', ''),
-                        'module': module_name,
-                        'line': line_num,
-                        'confidence': confidence,
-                        'warning': warning,
-                        'is_variable': '_var' in pattern_name
-                    })
-            except re.error as e:
-                logger.warning(f"Regex error for pattern {pattern_name}: {e}")
+        for node in ast.walk(tree):
+            node_type = type(node)
+            
+            if node_type is ast.Call:
+                func = node.func
+                if type(func) is ast.Attribute:
+                    if not (func.attr == 'import_module' and type(func.value) is ast.Name
+                            and func.value.id == 'importlib'):
+                        continue
+                    pattern_name = 'importlib'
+                elif type(func) is ast.Name and func.id == '__import__':
+                    pattern_name = '__import__'
+                else:
+                    continue
+                
+                if not node.args:
+                    continue
+                arg = node.args[0]
+                if type(arg) is ast.Constant and isinstance(arg.value, str):
+                    module_name = arg.value
+                elif type(arg) is ast.Name:
+                    pattern_name += '_var'
+                    module_name = arg.id
+                else:
+                    continue
+            
+            elif node_type is ast.If or node_type is ast.Try:
+                first = node.body[0] if node.body else None
+                if type(first) is not ast.Import:
+                    continue
+                pattern_name = 'conditional_import' if node_type is ast.If else 'try_import'
+                module_name = first.names[0].name
+            
+            else:
                 continue
+            
+            dynamic_imports.append(self._make_entry(pattern_name, module_name, node.lineno))
         
+        dynamic_imports.sort(key=itemgetter('line'))
         return dynamic_imports
+    
+    def _scan(self, source_code: bytes, regex: re.Pattern,
+              module_group: Dict[str, int]) -> List[Dict[str, Any]]:
+        """Run one combined pattern over the source and build result entries."""
+        dynamic_imports = []
+        
+        # Newline offsets, computed once: line lookup per match is a bisect
+        newline_offsets = [m.start() for m in _NEWLINE_RE.finditer(source_code)]
+        
+        for match in regex.finditer(source_code):
+            pattern_name = match.lastgroup
+            
+            # Get module name from the pattern's capture group
+            module_bytes = match.group(module_group[pattern_name])
+            module_name = module_bytes.decode('utf-8', 'replace') if module_bytes else 'unknown'
+            
+            # Calculate line number
+            line_num = bisect.bisect_left(newline_offsets, match.start()) + 1
+            
+            dynamic_imports.append(self._make_entry(pattern_name, module_name, line_num))
+        
+        return dynamic_imports
+    
+    def _make_entry(self, pattern_name: str, module_name: str, line_num: int) -> Dict[str, Any]:
+        """Build one result entry; everything but module/line is precomputed per pattern."""
+        confidence, warning = self._CLASSIFICATION[pattern_name]
+        label, is_variable = self._PATTERN_LABEL[pattern_name]
+        return {
+            'type': _DYNAMIC_IMPORT,
+            'pattern': label,
+            'module': module_name,
+            'line': line_num,
+            'confidence': confidence,
+            'warning': warning,
+            'is_variable': is_variable
+        }
 
 
 # ============================================================================
 # MAIN ANALYZER CLASS
 # ============================================================================
 
-class DependencyAnalyzer(ast.NodeVisitor):
+# visit_Call classification categories (see classify_call)
+CALL_FILE, CALL_CONFIG, CALL_ENV, CALL_API, CALL_SUBPROCESS, CALL_OTHER = range(6)
+
+_FILE_OP_NAMES = frozenset(('open', 'Path', 'read', 'write', 'load', 'dump'))
+
+# Case-insensitive superset of every keyword in _CALL_KEYWORDS: most call
+# names match none of them and are ruled out by this one search
+_CALL_CATEGORY_RE = re.compile(
+    r'config|yaml|json|getenv|environ|request|post|api|client|subprocess|popen|run|call|system',
+    re.IGNORECASE
+)
+
+# (category, match against lowercased name?, substrings), checked in order
+_CALL_KEYWORDS = (
+    (CALL_CONFIG, True, ('config', 'yaml', 'json')),
+    (CALL_ENV, False, ('getenv', 'environ')),
+    (CALL_API, True, ('request', 'post', 'api', 'client')),
+    (CALL_SUBPROCESS, False, ('subprocess', 'Popen', 'run', 'call', 'system')),
+)
+
+
+@lru_cache(maxsize=4096)
+def classify_call(func_name: str) -> int:
+    """
+    Classify a call name into one of the CALL_* categories.
+    
+    Call names repeat heavily within and across files, so results are
+    memoized and each distinct name runs the keyword cascade only once.
+    """
+    if func_name in _FILE_OP_NAMES:
+        return CALL_FILE
+    if not _CALL_CATEGORY_RE.search(func_name):
+        return CALL_OTHER
+    
+    func_name_lower = func_name.lower()
+    for category, use_lower, keywords in _CALL_KEYWORDS:
+        name = func_name_lower if use_lower else func_name
+        if any(keyword in name for keyword in keywords):
+            return category
+    return CALL_OTHER
+
+
+# Node types DependencyAnalyzer.analyze() never descends into: no handler
+# applies to them and they contain no Call/def/import nodes
+_LEAF_NODE_TYPES = frozenset(
+    {ast.Constant, ast.Name, ast.alias}
+    | {cls for base in (ast.expr_context, ast.operator, ast.boolop, ast.cmpop, ast.unaryop)
+       for cls in base.__subclasses__()}
+)
+
+# _get_value() dispatch by exact node type (AST node classes are always
+# leaves, so a dict lookup replaces the isinstance chain)
+_VALUE_HANDLERS = {
+    ast.Constant: lambda self, node: node.value,
+    ast.Name: lambda self, node: node.id,
+    ast.List: lambda self, node: [self._get_value(elt) for elt in node.elts],
+    ast.Tuple: lambda self, node: tuple(self._get_value(elt) for elt in node.elts),
+    ast.Dict: lambda self, node: {self._get_value(k): self._get_value(v)
+                                  for k, v in zip(node.keys, node.values) if k},
+    ast.Attribute: lambda self, node: self._get_name(node),
+    ast.Call: lambda self, node: f"{self._get_name(node.func)}(...)",
+}
+
+class DependencyAnalyzer:
     """
-    AST visitor to extract dependencies from Python source code.
+    AST walker to extract dependencies from Python source code.
     
     v2.0 Enhancements:
     - Decorator argument extraction
     - Relative import resolution
     - Metaclass detection
+    
+    Nodes are dispatched from a flat loop through a type -> handler table
+    (_DISPATCH) rather than ast.NodeVisitor's per-node getattr lookup.
     """
     
     def __init__(self, file_path: str, project_root: Path = None):
         """
         Initialize the analyzer.
         
+        Args:
+            file_path: Path to the file being analyzed
+            project_root: Project root for relative import resolution
+        """
+        # Per-file memo caches keyed by id(node); ids are only stable while
+        # the file's AST is alive, so they are cleared by reset()
+        self._name_cache: Dict[int, Optional[str]] = {}
+        self._dec_cache: Dict[int, Dict[str, Any]] = {}
+        
+        # add_argument calls already recorded by an enclosing function
+        self._seen_cli_calls: Set[int] = set()
+        
+        # Relative import resolution, memoized per (level, module)
+        self._relimport_cache: Dict[Tuple[int, str], str] = {}
+        self._package_parts: Optional[Tuple[str, ...]] = None
+        
+        self.reset(file_path, project_root)
+    
+    def reset(self, file_path: str, project_root: Path = None):
+        """
+        Prepare the analyzer for a new file.
+        
+        Lets one instance be reused across files (see _pooled_analyzer)
+        instead of allocating a new analyzer and caches for every file.
+        
         Args:
             file_path: Path to the file being analyzed
             project_root: Project root for relative import resolution
@@ -219,13 +524,23 @@ class DependencyAnalyzer(ast.NodeVisitor):
         self.file_path = file_path
         self.project_root = project_root or Path(file_path).parent.parent
         
-        # Initialize dependency info
+        # Fresh dependency info - the previous one belongs to the caller
         self.deps = DependencyInfo(file_path=file_path)
         
         # Context tracking
         self.current_class = None
         self.current_function = None
         
+        self._name_cache.clear()
+        self._dec_cache.clear()
+        self._seen_cli_calls.clear()
+        self._relimport_cache.clear()
+        self._package_parts = None
+        
+        # CLI arg extraction is skipped when the source never mentions
+        # argparse (set by analyze_file)
+        self.uses_argparse = True
+    
     # =========================================================================
     # TASK 1.1: Enhanced Decorator Analysis
     # =========================================================================
@@ -240,6 +555,15 @@ class DependencyAnalyzer(ast.NodeVisitor):
         Returns:
             Dict with decorator name, args, and kwargs
         """
+        cached = self._dec_cache.get(id(decorator_node))
+        if cached is not None:
+            return cached
+        result = self._analyze_decorator_uncached(decorator_node)
+        self._dec_cache[id(decorator_node)] = result
+        return result
+    
+    def _analyze_decorator_uncached(self, decorator_node: ast.expr) -> Dict[str, Any]:
+        """Compute _analyze_decorator() result without consulting the cache."""
         if isinstance(decorator_node, ast.Name):
             # Simple decorator: @property
             return {
@@ -288,25 +612,9 @@ class DependencyAnalyzer(ast.NodeVisitor):
         Returns:
             Python value or string representation
         """
-        if isinstance(node, ast.Constant):
-            return node.value
-        elif isinstance(node, ast.Num):  # Python 3.7 compatibility
-            return node.n
-        elif isinstance(node, ast.Str):  # Python 3.7 compatibility
-            return node.s
-        elif isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.List):
-            return [self._get_value(elt) for elt in node.elts]
-        elif isinstance(node, ast.Tuple):
-            return tuple(self._get_value(elt) for elt in node.elts)
-        elif isinstance(node, ast.Dict):
-            return {self._get_value(k): self._get_value(v) 
-                    for k, v in zip(node.keys, node.values) if k}
-        elif isinstance(node, ast.Attribute):
-            return self._get_name(node)
-        elif isinstance(node, ast.Call):
-            return f"{self._get_name(node.func)}(...)"
+        handler = _VALUE_HANDLERS.get(type(node))
+        if handler is not None:
+            return handler(self, node)
         return str(ast.dump(node))
     
     # =========================================================================
@@ -324,48 +632,100 @@ class DependencyAnalyzer(ast.NodeVisitor):
         Returns:
             Absolute module path or original if can't resolve
         """
+        # Identical relative specifiers are common within one module
+        key = (level, relative_module)
+        cached = self._relimport_cache.get(key)
+        if cached is not None:
+            return cached
+        
         try:
+            package_parts = self._get_package_parts()
+            
+            # Go up 'level' directories
+            if level > len(package_parts):
+                logger.warning(f"Can't resolve import level {level} from {self.file_path}")
+                resolved = relative_module or ''
+            else:
+                # Base package plus the relative module, joined in one go
+                base_parts = package_parts[:-level] if level > 0 else package_parts
+                if relative_module:
+                    base_parts = (*base_parts, relative_module)
+                resolved = '.'.join(base_parts)
+            
+        except Exception as e:
+            logger.warning(f"Error resolving relative import: {e}")
+            resolved = relative_module or ''
+        
+        self._relimport_cache[key] = resolved
+        return resolved
+    
+    def _get_package_parts(self) -> Tuple[str, ...]:
+        """Package path components of the current file (computed once per file)."""
+        if self._package_parts is None:
             file_path = Path(self.file_path)
             
             # Get package structure from file path
             if self.project_root and file_path.is_absolute():
                 try:
                     relative_path = file_path.relative_to(self.project_root)
-                    package_parts = list(relative_path.parts[:-1])  # Remove filename
+                    self._package_parts = relative_path.parts[:-1]  # Remove filename
                 except ValueError:
-                    package_parts = list(file_path.parts[:-1])
+                    self._package_parts = file_path.parts[:-1]
             else:
-                package_parts = list(file_path.parts[:-1])
-            
-            # Go up 'level' directories
-            if level > len(package_parts):
-                logger.warning(f"Can't resolve import level {level} from {file_path}")
-                return relative_module or ''
-            
-            # Calculate base package
-            if level > 0:
-                base_parts = package_parts[:-level] if level <= len(package_parts) else []
-            else:
-                base_parts = package_parts
-            
-            base_package = '.'.join(base_parts)
+                self._package_parts = file_path.parts[:-1]
+        return self._package_parts
+    
+    # =========================================================================
+    # AST Traversal
+    # =========================================================================
+    
+    def analyze(self, tree: ast.AST):
+        """
+        Walk the tree in source (pre-)order and dispatch nodes by type.
+        
+        Enclosing class/function context travels on the explicit stack, so
+        handlers see the same current_class/current_function values a
+        recursive visitor would give them.
+        """
+        # Hot loop: everything it touches per node is bound to a local
+        get_handler = self._DISPATCH.get
+        iter_children = ast.iter_child_nodes
+        leaf_types = _LEAF_NODE_TYPES
+        class_def = ast.ClassDef
+        function_defs = (ast.FunctionDef, ast.AsyncFunctionDef)
+        stack = [(tree, None, None)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            node, self.current_class, self.current_function = pop()
+            node_type = type(node)
+            handler = get_handler(node_type)
+            if handler is not None:
+                handler(self, node)
             
-            # Combine with relative module
-            if relative_module:
-                if base_package:
-                    return f"{base_package}.{relative_module}"
-                return relative_module
-            return base_package
+            child_class = self.current_class
+            child_function = self.current_function
+            if node_type is class_def:
+                child_class = node.name
+            elif node_type in function_defs:
+                child_function = node.name
             
-        except Exception as e:
-            logger.warning(f"Error resolving relative import: {e}")
-            return relative_module or ''
+            # Leaves (names, literals, docstrings, operators, contexts) have
+            # nothing to extract and are never pushed; children go on in
+            # reverse so they pop in source order
+            children = [child for child in iter_children(node)
+                        if type(child) not in leaf_types]
+            for child in reversed(children):
+                push((child, child_class, child_function))
+        
+        self.current_class = None
+        self.current_function = None
     
     # =========================================================================
-    # AST Visitors
+    # Node Handlers
     # =========================================================================
     
-    def visit_Import(self, node: ast.Import):
+    def _visit_import(self, node: ast.Import):
         """Extract import statements."""
         for alias in node.names:
             self.deps.imports.append({
@@ -375,9 +735,8 @@ class DependencyAnalyzer(ast.NodeVisitor):
                 'is_relative': False,
                 'resolved_module': alias.name
             })
-        self.generic_visit(node)
     
-    def visit_ImportFrom(self, node: ast.ImportFrom):
+    def _visit_import_from(self, node: ast.ImportFrom):
         """
         Extract from ... import statements with relative import resolution.
         """
@@ -400,9 +759,8 @@ class DependencyAnalyzer(ast.NodeVisitor):
                 'level': node.level if is_relative else 0,
                 'resolved_module': resolved_module
             })
-        self.generic_visit(node)
     
-    def visit_ClassDef(self, node: ast.ClassDef):
+    def _visit_class(self, node: ast.ClassDef):
         """
         Extract class definitions with metaclass detection (Task 2.2).
         """
@@ -439,13 +797,8 @@ class DependencyAnalyzer(ast.NodeVisitor):
         # Check if exported (not starting with _)
         if not node.name.startswith('_'):
             self.deps.exports.append(node.name)
-        
-        old_class = self.current_class
-        self.current_class = node.name
-        self.generic_visit(node)
-        self.current_class = old_class
     
-    def visit_FunctionDef(self, node: ast.FunctionDef):
+    def _visit_func(self, node: ast.FunctionDef):
         """
         Extract function definitions with decorator analysis (Task 1.1).
         """
@@ -478,19 +831,10 @@ class DependencyAnalyzer(ast.NodeVisitor):
             })
         
         # Check for CLI argument parsing
-        for child in ast.walk(node):
-            if isinstance(child, ast.Call):
-                func_name = self._get_call_name(child)
-                if func_name and ('argparse' in func_name or 'ArgumentParser' in func_name):
-                    self._analyze_cli_args(node)
-                    break
-        
-        old_function = self.current_function
-        self.current_function = node.name
-        self.generic_visit(node)
-        self.current_function = old_function
+        if self.uses_argparse:
+            self._analyze_cli_args(node)
     
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
+    def _visit_async_func(self, node: ast.AsyncFunctionDef):
         """Extract async function definitions."""
         decorators_info = [self._analyze_decorator(d) for d in node.decorator_list]
         args_info = self._extract_function_args(node.args)
@@ -506,11 +850,6 @@ class DependencyAnalyzer(ast.NodeVisitor):
         
         if not node.name.startswith('_'):
             self.deps.exports.append(node.name)
-        
-        old_function = self.current_function
-        self.current_function = node.name
-        self.generic_visit(node)
-        self.current_function = old_function
     
     def _extract_function_args(self, args: ast.arguments) -> List[Dict[str, Any]]:
         """Extract function argument information."""
@@ -518,45 +857,30 @@ class DependencyAnalyzer(ast.NodeVisitor):
         
         # Regular arguments
         for arg in args.args:
-            arg_info = {'name': arg.arg, 'type': 'arg'}
+            arg_info = {'name': arg.arg, 'type': _ARG}
             if arg.annotation:
                 arg_info['annotation'] = self._get_name(arg.annotation)
             result.append(arg_info)
         
         # *args
         if args.vararg:
-            result.append({'name': args.vararg.arg, 'type': 'vararg'})
+            result.append({'name': args.vararg.arg, 'type': _VARARG})
         
         # **kwargs
         if args.kwarg:
-            result.append({'name': args.kwarg.arg, 'type': 'kwarg'})
+            result.append({'name': args.kwarg.arg, 'type': _KWARG})
         
         return result
     
-    def visit_Call(self, node: ast.Call):
+    def _visit_call(self, node: ast.Call):
         """Extract function calls and detect special patterns."""
         func_name = self._get_call_name(node)
         
         if func_name:
-            # Detect file operations
-            if func_name in ['open', 'Path', 'read', 'write', 'load', 'dump']:
-                self._analyze_file_operation(node, func_name)
-            
-            # Detect config loading
-            elif 'config' in func_name.lower() or 'yaml' in func_name.lower() or 'json' in func_name.lower():
-                self._analyze_config_operation(node, func_name)
-            
-            # Detect environment variables
-            elif 'getenv' in func_name or 'environ' in func_name:
-                self._analyze_env_var(node, func_name)
-            
-            # Detect API calls
-            elif any(x in func_name.lower() for x in ['request', 'post', 'api', 'client']):
-                self._analyze_api_call(node, func_name)
-            
-            # Detect subprocess calls
-            elif any(x in func_name for x in ['subprocess', 'Popen', 'run', 'call', 'system']):
-                self._analyze_subprocess(node, func_name)
+            # Detect file / config / env / API / subprocess operations
+            handler = self._CALL_HANDLERS[classify_call(func_name)]
+            if handler is not None:
+                handler(self, node, func_name)
             
             # Record function call
             self.deps.function_calls.append({
@@ -564,8 +888,6 @@ class DependencyAnalyzer(ast.NodeVisitor):
                 'line': node.lineno,
                 'context': self.current_function or self.current_class
             })
-        
-        self.generic_visit(node)
     
     # =========================================================================
     # Helper Methods
@@ -580,9 +902,19 @@ class DependencyAnalyzer(ast.NodeVisitor):
         return None
     
     def _get_name(self, node: ast.expr) -> Optional[str]:
-        """Extract name from various node types."""
+        """Extract name from various node types (memoized per node)."""
         if node is None:
             return None
+        key = id(node)
+        cached = self._name_cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        name = self._get_name_uncached(node)
+        self._name_cache[key] = name
+        return name
+    
+    def _get_name_uncached(self, node: ast.expr) -> Optional[str]:
+        """Compute _get_name() result without consulting the cache."""
         if isinstance(node, ast.Name):
             return node.id
         elif isinstance(node, ast.Attribute):
@@ -603,9 +935,9 @@ class DependencyAnalyzer(ast.NodeVisitor):
         """Analyze file I/O operations."""
         if node.args:
             path = self._get_name(node.args[0])
-            operation = 'read' if 'read' in func_name or 'load' in func_name else 'write'
+            is_read = 'read' in func_name or 'load' in func_name
             
-            target = self.deps.file_reads if operation == 'read' else self.deps.file_writes
+            target = self.deps.file_reads if is_read else self.deps.file_writes
             target.append({
                 'path': path,
                 'operation': func_name,
@@ -672,74 +1004,126 @@ class DependencyAnalyzer(ast.NodeVisitor):
             })
     
     def _analyze_cli_args(self, node: ast.FunctionDef):
-        """Analyze CLI argument definitions."""
+        """
+        Analyze CLI argument definitions.
+        
+        Single walk over the function: add_argument calls are collected while
+        looking for argparse usage, and kept only if the function uses it.
+        """
+        uses_parser = False
+        add_argument_calls = []
         for child in ast.walk(node):
             if isinstance(child, ast.Call):
                 func_name = self._get_call_name(child)
-                if func_name and 'add_argument' in func_name:
-                    if child.args:
-                        arg_name = self._get_name(child.args[0])
-                        self.deps.cli_args.append({
-                            'arg': arg_name,
-                            'line': child.lineno
-                        })
+                if not func_name:
+                    continue
+                if 'argparse' in func_name or 'ArgumentParser' in func_name:
+                    uses_parser = True
+                if 'add_argument' in func_name and child.args:
+                    add_argument_calls.append(child)
+        
+        if not uses_parser:
+            return
+        
+        for child in add_argument_calls:
+            if id(child) in self._seen_cli_calls:
+                continue
+            self._seen_cli_calls.add(id(child))
+            self.deps.cli_args.append({
+                'arg': self._get_name(child.args[0]),
+                'line': child.lineno
+            })
+    
+    _DISPATCH = {
+        ast.Import: _visit_import,
+        ast.ImportFrom: _visit_import_from,
+        ast.ClassDef: _visit_class,
+        ast.FunctionDef: _visit_func,
+        ast.AsyncFunctionDef: _visit_async_func,
+        ast.Call: _visit_call,
+    }
+    
+    # Indexed by classify_call() category
+    _CALL_HANDLERS = (
+        _analyze_file_operation,    # CALL_FILE
+        _analyze_config_operation,  # CALL_CONFIG
+        _analyze_env_var,           # CALL_ENV
+        _analyze_api_call,          # CALL_API
+        _analyze_subprocess,        # CALL_SUBPROCESS
+        None,                       # CALL_OTHER
+    )
 
 
 # ============================================================================
 # ANALYSIS FUNCTIONS
 # ============================================================================
 
-def analyze_file(file_path: Path, project_root: Path = None) -> Optional[DependencyInfo]:
+# One reusable DependencyAnalyzer per thread (and so per pool worker process)
+_analyzer_pool = threading.local()
+
+
+def _pooled_analyzer(file_path: str, project_root: Path = None) -> DependencyAnalyzer:
+    """Return this thread's DependencyAnalyzer, reset for file_path."""
+    analyzer = getattr(_analyzer_pool, 'analyzer', None)
+    if analyzer is None:
+        analyzer = _analyzer_pool.analyzer = DependencyAnalyzer(file_path, project_root)
+    else:
+        analyzer.reset(file_path, project_root)
+    return analyzer
+
+
+def _build_metadata(deps: DependencyInfo, source: bytes, newline_count: int) -> Dict[str, Any]:
+    """Summary counters stored in DependencyInfo.metadata for indexing."""
+    return {
+        'total_functions': len(deps.function_definitions),
+        'total_classes': len(deps.class_hierarchy),
+        'total_imports': len(deps.imports),
+        'has_dynamic_imports': len(deps.dynamic_imports) > 0,
+        'has_dynamic_behavior': any(
+            c.get('has_dynamic_behavior') for c in deps.class_hierarchy
+        ),
+        'lines_of_code': newline_count + 1,
+        'file_size_bytes': len(source)
+    }
+
+
+def analyze_file(file_path: Path, project_root: Path = None,
+                 source: Optional[bytes] = None) -> Optional[DependencyInfo]:
     """
     Analyze a single Python file.
     
+    The file is memory-mapped and handed as bytes to both ast.parse() and the
+    regex scanners, so no decoded text copy of the source is ever made.
+    Files that contain none of the _INTEREST_RE tokens are returned as an
+    empty DependencyInfo without being parsed.
+    
     Args:
         file_path: Path to the Python file
         project_root: Project root for relative import resolution
+        source: Already-read file contents (skips opening the file)
         
     Returns:
         DependencyInfo object or None on error
     """
     try:
-        # Read source code
-        with open(file_path, 'r', encoding='utf-8') as f:
-            source = f.read()
-        
-        # Parse AST
-        tree = ast.parse(source, filename=str(file_path))
-        
-        # Run AST analyzer
-        analyzer = DependencyAnalyzer(str(file_path), project_root)
-        analyzer.visit(tree)
-        
-        # TASK 2.1: Detect dynamic imports
-        detector = DynamicImportDetector()
-        dynamic_imports = detector.detect_dynamic_imports(source, str(file_path))
-        analyzer.deps.dynamic_imports = dynamic_imports
-        
-        # Check for __main__ entry point
-        if '__name__' in source and '__main__' in source:
-            main_pos = source.find('__main__')
-            analyzer.deps.entry_points.append({
-                'type': 'main_guard',
-                'name': '__main__',
-                'line': source[:main_pos].count('\n') + 1
-            })
+        if source is not None:
+            return _analyze_source(source, file_path, project_root)
         
-        # Generate metadata
-        analyzer.deps.metadata = {
-            'total_functions': len(analyzer.deps.function_definitions),
-            'total_classes': len(analyzer.deps.class_hierarchy),
-            'total_imports': len(analyzer.deps.imports),
-            'has_dynamic_imports': len(dynamic_imports) > 0,
-            'has_dynamic_behavior': any(
-                c.get('has_dynamic_behavior') for c in analyzer.deps.class_hierarchy
-            ),
-            'lines_of_code': source.count('\n') + 1,
-            'file_size_bytes': len(source.encode('utf-8'))
-        }
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            # mmap cannot map an empty file
+            if os.fstat(fd).st_size:
+                source = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            else:
+                source = b''
+        finally:
+            os.close(fd)
         
-        return analyzer.deps
+        try:
+            return _analyze_source(source, file_path, project_root)
+        finally:
+            if isinstance(source, mmap.mmap):
+                source.close()
         
     except SyntaxError as e:
         logger.error(f"Syntax error in {file_path}: {e}")
@@ -749,45 +1133,348 @@ def analyze_file(file_path: Path, project_root: Path = None) -> Optional[Depende
         return None
 
 
-def analyze_directory(dir_path: Path, output_dir: Path, project_root: Path = None):
+def _analyze_source(source: bytes, file_path: Path, project_root: Path = None) -> DependencyInfo:
+    """Run the AST and regex analysis over raw source bytes (or an mmap)."""
+    # Fast path: nothing worth extracting, skip AST parse + visit
+    if _INTEREST_RE.search(source) is None:
+        deps = DependencyInfo(file_path=str(file_path))
+        deps.metadata = _build_metadata(deps, source, len(_NEWLINE_RE.findall(source)))
+        return deps
+    
+    # Parse AST (bytes input also honours PEP 263 coding declarations).
+    # compile() with PyCF_ONLY_AST is what ast.parse() wraps; calling it
+    # directly skips the wrapper, leaves type comments off (no extra
+    # tokenizer work) and doesn't inherit this module's compiler flags.
+    tree = compile(source, str(file_path), 'exec', flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+    
+    # Run AST analyzer
+    analyzer = _pooled_analyzer(str(file_path), project_root)
+    analyzer.uses_argparse = source.find(b'argparse') != -1
+    analyzer.analyze(tree)
+    
+    # TASK 2.1: Detect dynamic imports
+    detector = DynamicImportDetector()
+    dynamic_imports = detector.detect_dynamic_imports(source, str(file_path), tree)
+    analyzer.deps.dynamic_imports = dynamic_imports
+    
+    # Newlines are counted once; the file's line count and the main guard's
+    # line both derive from it
+    newline_count = len(_NEWLINE_RE.findall(source))
+    
+    # Check for __main__ entry point (one regex pass instead of separate
+    # __name__ / __main__ substring scans)
+    main_guard = _MAIN_GUARD_RE.search(source)
+    if main_guard:
+        # Counting back from the end only rescans the tail after the guard,
+        # which is usually the last few lines of the file
+        newlines_after = len(_NEWLINE_RE.findall(source, main_guard.start()))
+        analyzer.deps.entry_points.append({
+            'type': 'main_guard',
+            'name': '__main__',
+            'line': newline_count - newlines_after + 1
+        })
+    
+    # Generate metadata
+    analyzer.deps.metadata = _build_metadata(analyzer.deps, source, newline_count)
+    
+    return analyzer.deps
+
+
+def _iter_py_files(root: Path):
+    """
+    Yield the *.py files under root, pruning _SKIP_DIRS subtrees.
+    
+    An os.scandir walk never descends into skipped directories (rglob
+    would enumerate them fully before the path filter), and scandir
+    entries answer is_dir() without an extra stat on most filesystems.
+    """
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith('.py'):
+                        yield Path(entry.path)
+        except OSError as e:
+            logger.warning(f"Cannot scan {directory}: {e}")
+            continue
+        # Reversed so subdirectories are visited in scandir order
+        stack.extend(reversed(subdirs))
+
+
+def _read_source(file_path: Path) -> Optional[bytes]:
+    """
+    Read a file's raw bytes; None if it can't be read (analyze_file reports why).
+    
+    Sized os.read() on the raw descriptor: normally one read syscall, with no
+    buffered/text layer and no extra read to detect EOF.
+    """
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            data = os.read(fd, size)
+            if len(data) < size:
+                # Short read (very large file or special FS): read the rest
+                chunks = [data]
+                while True:
+                    chunk = os.read(fd, size)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                data = b''.join(chunks)
+            return data
+        finally:
+            os.close(fd)
+    except OSError:
+        return None
+
+
+def _prefetch_sources(paths: List[Path], max_threads: int = 32):
+    """
+    Yield (path, source bytes) in order while reading ahead on a thread pool.
+    
+    File reads release the GIL, so up to 2 * max_threads reads stay in flight
+    while the caller parses the current file; the bounded window keeps memory
+    flat on large trees.
+    """
+    window = 2 * max_threads
+    with ThreadPoolExecutor(max_workers=max_threads) as reader:
+        pending = deque()
+        path_iter = iter(paths)
+        for path in path_iter:
+            pending.append((path, reader.submit(_read_source, path)))
+            if len(pending) >= window:
+                break
+        while pending:
+            path, future = pending.popleft()
+            next_path = next(path_iter, None)
+            if next_path is not None:
+                pending.append((next_path, reader.submit(_read_source, next_path)))
+            yield path, future.result()
+
+
+# Per-process DependencyCache instances, keyed by (database path, project root)
+_caches: Dict[Tuple[Path, Optional[Path]], DependencyCache] = {}
+
+
+def _get_cache(cache_path: Path, project_root: Path = None) -> DependencyCache:
+    """
+    Return this process's DependencyCache for cache_path.
+    
+    Module paths in a payload are relative to project_root, so the root is
+    part of the version: entries from another root never match.
+    """
+    key = (cache_path, project_root)
+    cache = _caches.get(key)
+    if cache is None:
+        cache = _caches[key] = DependencyCache(cache_path, f"{ANALYSIS_VERSION}:{project_root}")
+    return cache
+
+
+def _analyze_to_payload(py_file: Path, project_root: Path = None,
+                        source: Optional[bytes] = None,
+                        cache_path: Optional[Path] = None) -> Optional[bytes]:
+    """
+    Worker function: analyze one file and serialize the result.
+    
+    With a cache_path, the payload is looked up by the SHA-256 of the
+    source first; unchanged files skip parsing and serialization entirely
+    (their payload keeps the timestamp of the run that produced it).
+    
+    Returns:
+        Encoded JSON payload, or None if the file couldn't be analyzed
+    """
+    cache = None
+    if cache_path is not None:
+        if source is None:
+            source = _read_source(py_file)
+        if source is not None:
+            try:
+                cache = _get_cache(cache_path, project_root)
+                sha = cache.digest(source)
+                payload = cache.get(str(py_file), sha)
+                if payload is not None:
+                    return payload
+            except sqlite3.Error as e:
+                logger.warning(f"Dependency cache unavailable ({cache_path}): {e}")
+                cache = None
+    
+    deps = analyze_file(py_file, project_root, source)
+    if not deps:
+        return None
+    payload = _serialize(deps)
+    
+    if cache is not None:
+        try:
+            cache.put(str(py_file), sha, payload, py_file.stat().st_mtime)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not update dependency cache ({cache_path}): {e}")
+    return payload
+
+
+def _analyze_batch(py_files: List[Path], project_root: Path = None,
+                   cache_path: Optional[Path] = None) -> List[Optional[bytes]]:
+    """
+    Worker function: analyze a batch of files (one pool task per batch).
+    
+    Returns:
+        One payload (or None) per file, in batch order
+    """
+    return [_analyze_to_payload(py_file, project_root, None, cache_path)
+            for py_file in py_files]
+
+
+def _write_output(output_file: Path, payload: bytes):
+    """
+    Write one JSON payload (runs on the single writer thread).
+    
+    The parent directory must already exist - analyze_directory creates
+    all output directories once up front.
+    """
+    output_file.write_bytes(payload)
+    logger.debug(f"  → Saved to: {output_file}")
+
+
+def _iter_batch_results(executor: ProcessPoolExecutor, py_files: List[Path],
+                        output_files: List[Path], workers: int,
+                        project_root: Path = None, cache_path: Optional[Path] = None):
+    """
+    Submit py_files to the pool in batches and yield
+    (py_file, output_file, payload) as each batch completes.
+    """
+    batch_size = max(1, len(py_files) // (4 * workers))
+    batches = {}
+    for start in range(0, len(py_files), batch_size):
+        batch = py_files[start:start + batch_size]
+        future = executor.submit(_analyze_batch, batch, project_root, cache_path)
+        batches[future] = (batch, output_files[start:start + batch_size])
+    
+    for future in as_completed(batches):
+        batch, batch_outputs = batches.pop(future)
+        yield from zip(batch, batch_outputs, future.result())
+
+
+def analyze_directory(dir_path: Path, output_dir: Path, project_root: Path = None,
+                      max_workers: int = None, executor: ProcessPoolExecutor = None,
+                      cache_path: Optional[Path] = None):
     """
     Analyze all Python files in a directory.
     
+    Files are independent, so they are analyzed in parallel across a
+    process pool (each worker does its own AST parse, bypassing the GIL).
+    In serial mode, file reads are prefetched on a thread pool so disk I/O
+    overlaps with parsing.
+    
+    Workers only return encoded JSON; a single writer thread drains the
+    outputs as batches complete (in any order), so writes overlap with
+    analysis, never contend with each other, and a slow file doesn't hold
+    back the results queued behind it. Files whose outputs would collide
+    (same stem in different subdirectories) are resolved up front. Workers do not log progress - this process
+    reports it every _PROGRESS_INTERVAL files (per-file lines are DEBUG).
+    
     Args:
         dir_path: Directory to analyze
         output_dir: Output directory for JSON files
         project_root: Project root for relative import resolution
+        max_workers: Number of worker processes (default: os.cpu_count(),
+                     1 = analyze serially in this process); with an
+                     executor, only used to size task chunks
+        executor: Existing process pool to use instead of starting one
+                  (lets --all reuse a single pool across directories)
+        cache_path: SQLite dependency cache (see _dep_cache); None disables it
     """
     output_dir.mkdir(parents=True, exist_ok=True)
     
+    # Output names are flat ({stem}_dependencies.json), so same-named files
+    # in different subdirectories share one output; the last one found wins
+    # and the others aren't analyzed at all
+    sources_by_output = {}
+    for py_file in _iter_py_files(dir_path):
+        output_file = output_dir / f"{py_file.stem}_dependencies.json"
+        shadowed = sources_by_output.get(output_file)
+        if shadowed is not None:
+            logger.warning(f"{py_file} overwrites output of {shadowed}: {output_file.name}")
+        sources_by_output[output_file] = py_file
+    output_files = list(sources_by_output)
+    py_files = list(sources_by_output.values())
+    
+    # One mkdir per distinct output directory instead of one per file
+    for parent in {output_file.parent for output_file in output_files}:
+        parent.mkdir(parents=True, exist_ok=True)
+    
+    workers = max_workers or os.cpu_count() or 1
+    if executor is None:
+        workers = min(workers, len(py_files)) or 1
+    
     files_processed = 0
     files_failed = 0
+    writes = []
     
-    for py_file in dir_path.rglob('*.py'):
-        # Skip unwanted directories
-        if '__pycache__' in str(py_file) or 'vllm-latest' in str(py_file):
-            continue
-        
-        logger.info(f"Analyzing: {py_file}")
-        deps = analyze_file(py_file, project_root)
+    # Exit order matters: the process pool (if any) is shut down first,
+    # then the writer finishes the queued outputs
+    with ThreadPoolExecutor(max_workers=1) as writer, ExitStack() as stack:
+        if executor is None and workers == 1:
+            payloads = (
+                _analyze_to_payload(py_file, project_root, source, cache_path)
+                for py_file, source in _prefetch_sources(py_files)
+            )
+            results = zip(py_files, output_files, payloads)
+        else:
+            if executor is None:
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            results = _iter_batch_results(executor, py_files, output_files,
+                                          workers, project_root, cache_path)
         
-        if deps:
-            # Save to JSON
-            relative_path = py_file.relative_to(dir_path.parent)
-            output_file = output_dir / f"{relative_path.stem}_dependencies.json"
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(asdict(deps), f, indent=2, ensure_ascii=False)
-            
-            logger.info(f"  → Saved to: {output_file}")
+        for py_file, output_file, payload in results:
+            logger.debug(f"Analyzed: {py_file}")
+            if payload is None:
+                files_failed += 1
+                continue
+            writes.append(writer.submit(_write_output, output_file, payload))
             files_processed += 1
-        else:
-            files_failed += 1
+            if files_processed % _PROGRESS_INTERVAL == 0:
+                logger.info(f"  ... {files_processed}/{len(py_files)} files processed")
+    
+    # Surface any write error
+    for write in writes:
+        write.result()
     
     logger.info(f"Analysis complete: {files_processed} files processed, {files_failed} failed")
 
 
+async def _analyze_all(base_dir: Path, subdirs: List[str], output_dir: Path,
+                       max_workers: int = None, cache_path: Optional[Path] = None):
+    """
+    Analyze several project subdirectories concurrently (--all).
+    
+    Each analyze_directory call runs on its own thread, so directory
+    walks, reads and output writes of one subtree overlap with the others;
+    the CPU-bound analysis of all of them shares one process pool instead
+    of starting a new one per subdirectory.
+    """
+    import asyncio
+    
+    workers = max_workers or os.cpu_count() or 1
+    with ExitStack() as stack:
+        executor = None
+        if workers > 1:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+        for subdir in subdirs:
+            print(f"\n=== Analyzing {subdir}/ ===")
+        await asyncio.gather(*(
+            asyncio.to_thread(analyze_directory, base_dir / subdir,
+                              output_dir / subdir.replace('/', '_'), base_dir,
+                              max_workers, executor, cache_path)
+            for subdir in subdirs
+        ))
+
+
 # ============================================================================
 # CLI INTERFACE
 # ============================================================================
@@ -826,6 +1513,10 @@ v2.0 Features:
     parser.add_argument('--all', action='store_true', help='Analyze entire project')
     parser.add_argument('--output-dir', type=str, default='docs/memory/dependencies',
                        help='Output directory for dependency JSON files')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Parallel worker processes for directory analysis (default: CPU count)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignore and do not update the dependency cache (.cache.sqlite)')
     parser.add_argument('--version', action='store_true', help='Show version')
     
     args = parser.parse_args()
@@ -836,6 +1527,7 @@ v2.0 Features:
     
     base_dir = Path(__file__).parent.parent  # Project root
     output_dir = base_dir / args.output_dir
+    cache_path = None if args.no_cache else output_dir / '.cache.sqlite'
     
     if args.target:
         target_file = base_dir / args.target
@@ -846,9 +1538,7 @@ v2.0 Features:
         deps = analyze_file(target_file, base_dir)
         if deps:
             output_file = output_dir / f"{target_file.stem}_dependencies.json"
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(asdict(deps), f, indent=2, ensure_ascii=False)
+            _write_json(output_file, deps)
             print(f"✅ Analysis saved to: {output_file}")
             print(f"   Functions: {deps.metadata.get('total_functions', 0)}")
             print(f"   Classes: {deps.metadata.get('total_classes', 0)}")
@@ -861,14 +1551,15 @@ v2.0 Features:
         if not target_dir.exists():
             print(f"Error: Directory not found: {target_dir}")
             return
-        analyze_directory(target_dir, output_dir, base_dir)
+        analyze_directory(target_dir, output_dir, base_dir, args.workers,
+                          cache_path=cache_path)
     
     elif args.all:
-        for subdir in ['processing', 'utils', 'scripts', 'docs/automation']:
-            target_dir = base_dir / subdir
-            if target_dir.exists():
-                print(f"\n=== Analyzing {subdir}/ ===")
-                analyze_directory(target_dir, output_dir / subdir.replace('/', '_'), base_dir)
+        # Only --all needs asyncio; imported here to keep startup fast
+        import asyncio
+        subdirs = [subdir for subdir in ['processing', 'utils', 'scripts', 'docs/automation']
+                   if (base_dir / subdir).exists()]
+        asyncio.run(_analyze_all(base_dir, subdirs, output_dir, args.workers, cache_path))
     
     else:
         parser.print_help()
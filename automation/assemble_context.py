@@ -35,8 +35,10 @@ DEPENDENCIES (Quick Reference):
     Data:
         - Input: docs/specs/, docs/wiki/, processing/, utils/, scripts/
         - Output: docs/temp/context.md (default)
+        - Cache: docs/memory/corpus.json, corpus.<generation>.npy, corpus_scales.<generation>.npy (int8 file embeddings for ranking)
     External:
         - sentence-transformers (optional, for semantic search)
+        - numpy (optional, semantic search query cache)
 
 RECENT CHANGES:
     2025-12-11: Enhanced v2 with dual_memory integration, metadata/provenance
@@ -50,10 +52,15 @@ import sys
 import json
 import re
 import time
+import hashlib
+import heapq
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Set, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 
 # Add project root to path
 # Add project root to Python path for portable imports
@@ -63,6 +70,179 @@ from utils.docs_logger import DocsLogger
 
 logger = DocsLogger("assemble_context")
 
+# numpy is only needed for the semantic query cache (it's installed
+# whenever dual_memory embeddings are available)
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Semantic search caching: repeated queries are answered from the exact
+# cache, near-duplicates (cosine >= threshold) from the semantic cache
+SEARCH_CACHE_SIZE = 128
+SEMANTIC_CACHE_SIZE = 64
+SEMANTIC_CACHE_THRESHOLD = 0.95
+
+# Embedding-based file ranking: every rankable file is embedded once (first
+# CORPUS_TEXT_CHARS characters) and the matrix is persisted under
+# docs/memory/ until any file is added, removed or modified. Rows are stored
+# as int8 with one float32 scale per row (a quarter of the fp32 size).
+# The array files are named after the manifest's generation id, so a reader
+# never pairs a matrix with scales or a manifest from another save.
+CORPUS_MATRIX_FILE = 'corpus.{generation}.npy'
+CORPUS_SCALES_FILE = 'corpus_scales.{generation}.npy'
+CORPUS_MANIFEST_FILE = 'corpus.json'
+CORPUS_FORMAT = 'int8-rowscale-v2'
+CORPUS_TEXT_CHARS = 8000
+
+# Keyword ranking reads candidate files on at most this many threads
+RANK_READ_THREADS = 16
+
+# Directories (under the project root) whose *.py files are ranked as code
+CODE_DIRS = ('processing', 'utils', 'scripts')
+
+# Write buffer for the streamed context report
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+# Semantic tag patterns: an opening tag, and a complete tag block
+# (name, content) closed by the matching <!--/TAG:name-->
+_TAG_NAME_RE = re.compile(r'<!--TAG:([a-zA-Z0-9_]+)-->')
+_TAG_RE = re.compile(r'<!--TAG:([a-zA-Z0-9_]+)-->(.*?)<!--/TAG:\1-->', re.DOTALL)
+
+# Content type of a search result path: path markers first, in order,
+# then the file suffix
+_PATH_CONTENT_TYPES = (('spec', 'spec'), ('wiki', 'wiki'))
+_SUFFIX_CONTENT_TYPES = {'.py': 'code', '.md': 'readme'}
+
+
+# ContextPackage list that collects the files of each content type
+_PACKAGE_LIST_BY_CONTENT_TYPE = {
+    'readme': 'readme_files',
+    'spec': 'spec_files',
+    'wiki': 'wiki_files',
+    'code': 'code_files',
+    'dependency': 'dependency_maps',
+}
+
+
+def _content_type_for(source_file: str) -> str:
+    """Classify a result path as 'spec', 'wiki', 'code', 'readme' or 'other'."""
+    for marker, content_type in _PATH_CONTENT_TYPES:
+        if marker in source_file:
+            return content_type
+    _, dot, suffix = source_file.rpartition('.')
+    return _SUFFIX_CONTENT_TYPES.get('.' + suffix if dot else '', 'other')
+
+# ============================================================================
+# FILE CACHE
+# ============================================================================
+
+# Ranking, tag extraction and output generation read overlapping sets of
+# files; contents are cached per (path, mtime_ns), so an edited file is
+# simply a new key and stale entries age out of the LRU.
+
+@lru_cache(maxsize=512)
+def _read_text_cached(path: str, mtime_ns: int) -> str:
+    """Decoded UTF-8 content of a file (mtime_ns is only part of the key)."""
+    return Path(path).read_text(encoding='utf-8')
+
+
+@lru_cache(maxsize=512)
+def _tag_names_cached(path: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Opening semantic tag names of a file, in order of appearance."""
+    content = _read_text_cached(path, mtime_ns)
+    
+    # Extract all tag identifiers from file
+    return tuple(_TAG_NAME_RE.findall(content))
+
+
+@lru_cache(maxsize=64)
+def _count_files_cached(directory: str, mtime_ns: int, suffix: str) -> int:
+    """Number of (non-hidden) files in directory ending with suffix."""
+    with os.scandir(directory) as entries:
+        return sum(
+            1 for entry in entries
+            if entry.name.endswith(suffix) and not entry.name.startswith('.') and entry.is_file()
+        )
+
+
+@lru_cache(maxsize=16)
+def _list_files_cached(directories: Tuple[Tuple[str, int], ...], suffix: str) -> Tuple[str, ...]:
+    """
+    Paths of the files ending with suffix in each (directory, mtime_ns),
+    in directory order, then scandir order (the order glob() yields).
+    """
+    files = []
+    for directory, _ in directories:
+        with os.scandir(directory) as entries:
+            files.extend(
+                entry.path for entry in entries
+                if entry.name.endswith(suffix) and entry.is_file()
+            )
+    return tuple(files)
+
+
+def _keyword_score(
+    content_lower,
+    filename_lower: str,
+    keywords: List[str],
+    needles: List
+) -> Tuple[int, List[str]]:
+    """
+    Keyword relevance of one file: 10 per keyword in the filename plus the
+    keyword's content occurrences, capped at 10 per keyword.
+    
+    content_lower and needles are both bytes or both str. count() is a
+    C-level substring search per keyword, which measures faster than a
+    single pass of a keyword alternation regex (with or without IGNORECASE).
+    
+    Returns:
+        (score, matched keywords in keyword order)
+    """
+    score = 0
+    matched_keywords = []
+    count = content_lower.count
+    
+    for keyword, needle in zip(keywords, needles):
+        # Filename match (higher weight)
+        if keyword in filename_lower:
+            score += 10
+            matched_keywords.append(keyword)
+        
+        # Content matches
+        content_matches = count(needle)
+        if content_matches:
+            score += content_matches if content_matches < 10 else 10  # Cap at 10
+            if keyword not in matched_keywords:
+                matched_keywords.append(keyword)
+    
+    return score, matched_keywords
+
+
+def _compile_synonyms(synonyms: Dict[str, List[str]]) -> Tuple[re.Pattern, Dict[str, str]]:
+    """
+    Build one matcher for every synonym variant.
+    
+    The alternation sits inside a lookahead, so finditer() tries it at
+    every position of the text and overlapping variants are all found -
+    equivalent to a `variant in text` test per variant, but in one pass.
+    
+    Returns:
+        (compiled pattern, variant -> canonical keyword)
+    """
+    canonical_by_variant = {
+        variant: canonical
+        for canonical, variants in synonyms.items()
+        for variant in variants
+    }
+    # Longest first, so a variant is never shadowed by its own prefix
+    alternation = '|'.join(
+        re.escape(variant) for variant in sorted(canonical_by_variant, key=len, reverse=True)
+    )
+    return re.compile(f'(?=({alternation}))'), canonical_by_variant
+
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
@@ -81,6 +261,15 @@ class FileMetadata:
     line_range: Optional[Tuple[int, int]] = None
 
 
+@dataclass
+class FilePayload:
+    """Content and tags of a file, as read while ranking it."""
+    path: str
+    content: str
+    tags: List[str]
+    mtime_ns: int
+
+
 @dataclass
 class ContextPackage:
     """Assembled context for a task with rich metadata."""
@@ -92,6 +281,12 @@ class ContextPackage:
     dependency_maps: List[str] = field(default_factory=list)
     related_tags: List[str] = field(default_factory=list)
     
+    # (content_type, path) pairs already in one of the lists above
+    listed: Set[Tuple[str, str]] = field(default_factory=set, repr=False)
+    
+    # Contents already in memory, so the report doesn't read them again
+    payloads: Dict[str, FilePayload] = field(default_factory=dict, repr=False)
+    
     # NEW: Enhanced metadata
     file_metadata: Dict[str, FileMetadata] = field(default_factory=dict)
     assembly_stats: Dict[str, Any] = field(default_factory=dict)
@@ -133,6 +328,9 @@ class ContextAssembler:
         'test': ['test', 'testing', 'validation'],
     }
     
+    # All variants in a single pattern (see _compile_synonyms)
+    _SYNONYM_RE, _CANONICAL_BY_VARIANT = _compile_synonyms(KEYWORD_SYNONYMS)
+    
     def __init__(self, project_root: Path):
         """
         Initialize context assembler with optional dual_memory.
@@ -143,6 +341,10 @@ class ContextAssembler:
         # Store project root for resolving relative paths
         self.project_root = project_root
         
+        # Prefix stripped from paths found under project_root (cheaper than
+        # Path.relative_to for every ranked file)
+        self._root_prefix = os.path.join(os.fspath(project_root), '')
+        
         # Docs directory contains specs, wiki, automation scripts
         self.docs_dir = project_root / 'docs'
         
@@ -155,6 +357,18 @@ class ContextAssembler:
         # Flag: True if semantic search available, False for keyword fallback
         self.use_semantic = False
         
+        # Semantic search result caches (see _cached_unified_search):
+        # sha256(normalized query) -> results, and (unit query embedding, results)
+        self._search_cache: Dict[str, list] = {}
+        self._semantic_cache = deque(maxlen=SEMANTIC_CACHE_SIZE)
+        
+        # Embedded file corpus for ranking (built lazily, see _load_corpus)
+        self._corpus = None
+        self._corpus_failed = False
+        
+        # Results of shared stages while assemble_batch runs (see _shared)
+        self._batch_stages: Optional[Dict[Any, Any]] = None
+        
         # Try to initialize dual_memory for semantic search
         self._init_dual_memory()
     
@@ -220,7 +434,7 @@ class ContextAssembler:
         
         # Find dependency maps for code files
         for code_file in package.code_files:
-            dep_map = self._find_dependency_map(code_file)
+            dep_map = self._shared(('dependency_map', code_file), self._find_dependency_map, code_file)
             if dep_map:
                 self._add_file_with_metadata(
                     package, dep_map,
@@ -230,7 +444,7 @@ class ContextAssembler:
                 )
         
         # Add project structure tree
-        package.project_tree = self._generate_project_tree()
+        package.project_tree = self._shared(('project_tree',), self._generate_project_tree)
         
         # Assembly stats
         elapsed = time.time() - start_time
@@ -304,7 +518,7 @@ class ContextAssembler:
                 break
         
         # Find dependency map
-        dep_map = self._find_dependency_map(file_path)
+        dep_map = self._shared(('dependency_map', file_path), self._find_dependency_map, file_path)
         if dep_map:
             self._add_file_with_metadata(
                 package, dep_map,
@@ -317,7 +531,7 @@ class ContextAssembler:
         package.related_tags = self._extract_tags_from_file(file_path)
         
         # Add project structure
-        package.project_tree = self._generate_project_tree()
+        package.project_tree = self._shared(('project_tree',), self._generate_project_tree)
         
         # Stats
         elapsed = time.time() - start_time
@@ -363,7 +577,7 @@ class ContextAssembler:
                 if component_name.lower() in py_file.name.lower():
                     self._add_file_with_metadata(
                         package,
-                        str(py_file.relative_to(self.project_root)),
+                        self._relative(py_file),
                         reason=f"Component file matching '{component_name}'",
                         score=0.9,
                         content_type='code'
@@ -378,7 +592,10 @@ class ContextAssembler:
                 reason=spec['reason'],
                 score=spec['score'] / 100,  # Normalize
                 content_type='spec',
-                keywords=spec.get('keywords', [])
+                keywords=spec.get('keywords', []),
+                payload=spec.get('payload'),
+                size_kb=spec.get('size_kb'),
+                last_modified=spec.get('last_modified')
             )
         
         # Find wiki pages
@@ -390,11 +607,14 @@ class ContextAssembler:
                 reason=wiki['reason'],
                 score=wiki['score'] / 100,
                 content_type='wiki',
-                keywords=wiki.get('keywords', [])
+                keywords=wiki.get('keywords', []),
+                payload=wiki.get('payload'),
+                size_kb=wiki.get('size_kb'),
+                last_modified=wiki.get('last_modified')
             )
         
         # Add project structure
-        package.project_tree = self._generate_project_tree()
+        package.project_tree = self._shared(('project_tree',), self._generate_project_tree)
         
         # Stats
         elapsed = time.time() - start_time
@@ -408,6 +628,48 @@ class ContextAssembler:
         
         return package
     
+    def assemble_batch(self, requests: List[Tuple[str, str]]) -> List[ContextPackage]:
+        """
+        Assemble several contexts, sharing the stages they have in common.
+        
+        The assemble_for_* pipelines overlap heavily (main README, project
+        tree, spec/wiki/code ranking for the same keywords, dependency map
+        lookups, per-file stats and tags). Within a batch each such stage
+        runs once per distinct input and its result is reused by every
+        package that needs it.
+        
+        Args:
+            requests: (kind, value) pairs, kind being 'task', 'file' or
+                      'component' (the argument of the matching assemble_for_*)
+        
+        Returns:
+            One ContextPackage per request, in order
+        """
+        assemblers = {
+            'task': self.assemble_for_task,
+            'file': self.assemble_for_file,
+            'component': self.assemble_for_component,
+        }
+        self._batch_stages = {}
+        try:
+            return [assemblers[kind](value) for kind, value in requests]
+        finally:
+            self._batch_stages = None
+    
+    def _shared(self, key: Tuple, compute, *args):
+        """
+        compute(*args), reused for the same key within assemble_batch.
+        
+        Outside a batch the stage always runs, so single assemblies see
+        the current state of the tree.
+        """
+        stages = self._batch_stages
+        if stages is None:
+            return compute(*args)
+        if key not in stages:
+            stages[key] = compute(*args)
+        return stages[key]
+    
     # ========================================================================
     # SEMANTIC SEARCH
     # ========================================================================
@@ -415,21 +677,12 @@ class ContextAssembler:
     def _assemble_semantic(self, package: ContextPackage, query: str):
         """Use dual_memory for semantic search."""
         try:
-            results = self.dual_memory.unified_search(query, top_k=15)
+            results = self._cached_unified_search(query, top_k=15)
             
             for result in results:
                 # Determine content type from path
                 source_file = result.source_file
-                if 'spec' in source_file:
-                    content_type = 'spec'
-                elif 'wiki' in source_file:
-                    content_type = 'wiki'
-                elif source_file.endswith('.py'):
-                    content_type = 'code'
-                elif source_file.endswith('.md'):
-                    content_type = 'readme'
-                else:
-                    content_type = 'other'
+                content_type = _content_type_for(source_file)
                 
                 self._add_file_with_metadata(
                     package,
@@ -446,6 +699,57 @@ class ContextAssembler:
             logger.warning(f"Semantic search failed, using keyword fallback: {e}")
             self._assemble_keyword(package)
     
+    def _cached_unified_search(self, query: str, top_k: int) -> list:
+        """
+        dual_memory.unified_search() behind a two-tier query cache.
+        
+        1. Exact: results keyed by the hash of the normalized query.
+        2. Semantic: the query is embedded once and compared with the
+           embeddings of previously searched queries; a cosine similarity
+           >= SEMANTIC_CACHE_THRESHOLD reuses that query's results.
+        On a miss, the same embedding is handed to unified_search, so the
+        query is still embedded only once.
+        """
+        key = hashlib.sha256(f"{top_k}:{query.strip().lower()}".encode('utf-8')).hexdigest()
+        results = self._search_cache.get(key)
+        if results is not None:
+            logger.info("Semantic search: exact cache hit")
+            return results
+        
+        query_embedding = None
+        unit_embedding = None
+        if HAS_NUMPY:
+            query_embedding = self.dual_memory.embed_query(query)
+            unit_embedding = np.asarray(query_embedding, dtype=np.float32)
+            norm = float(np.linalg.norm(unit_embedding))
+            if norm > 0:
+                unit_embedding /= norm
+                cached = [(embedding, hit) for embedding, hit in self._semantic_cache
+                          if embedding.shape == unit_embedding.shape]
+                if cached:
+                    similarities = np.stack([embedding for embedding, _ in cached]) @ unit_embedding
+                    best = int(np.argmax(similarities))
+                    if similarities[best] >= SEMANTIC_CACHE_THRESHOLD:
+                        logger.info(f"Semantic search: similar query cache hit ({similarities[best]:.3f})")
+                        results = cached[best][1]
+                        self._remember_search(key, results)
+                        return results
+            else:
+                unit_embedding = None
+        
+        results = self.dual_memory.unified_search(query, top_k=top_k,
+                                                  query_embedding=query_embedding)
+        self._remember_search(key, results)
+        if unit_embedding is not None:
+            self._semantic_cache.append((unit_embedding, results))
+        return results
+    
+    def _remember_search(self, key: str, results: list):
+        """Store results in the exact cache, evicting the oldest entry when full."""
+        if len(self._search_cache) >= SEARCH_CACHE_SIZE:
+            self._search_cache.pop(next(iter(self._search_cache)))
+        self._search_cache[key] = results
+    
     def _assemble_keyword(self, package: ContextPackage):
         """Keyword-based assembly (fallback)."""
         # Find specs
@@ -457,7 +761,10 @@ class ContextAssembler:
                 reason=spec['reason'],
                 score=spec['score'] / 100,
                 content_type='spec',
-                keywords=spec.get('keywords', [])
+                keywords=spec.get('keywords', []),
+                payload=spec.get('payload'),
+                size_kb=spec.get('size_kb'),
+                last_modified=spec.get('last_modified')
             )
         
         # Find wiki
@@ -469,7 +776,10 @@ class ContextAssembler:
                 reason=wiki['reason'],
                 score=wiki['score'] / 100,
                 content_type='wiki',
-                keywords=wiki.get('keywords', [])
+                keywords=wiki.get('keywords', []),
+                payload=wiki.get('payload'),
+                size_kb=wiki.get('size_kb'),
+                last_modified=wiki.get('last_modified')
             )
         
         # Find code
@@ -481,7 +791,10 @@ class ContextAssembler:
                 reason=code['reason'],
                 score=code['score'] / 100,
                 content_type='code',
-                keywords=code.get('keywords', [])
+                keywords=code.get('keywords', []),
+                payload=code.get('payload'),
+                size_kb=code.get('size_kb'),
+                last_modified=code.get('last_modified')
             )
     
     # ========================================================================
@@ -490,15 +803,13 @@ class ContextAssembler:
     
     def _extract_keywords_advanced(self, text: str) -> List[str]:
         """Extract keywords with synonym support (RU/EN)."""
-        keywords = set()
-        text_lower = text.lower()
+        canonical_by_variant = self._CANONICAL_BY_VARIANT
         
-        # Check all synonyms
-        for canonical, variants in self.KEYWORD_SYNONYMS.items():
-            for variant in variants:
-                if variant in text_lower:
-                    keywords.add(canonical)
-                    break
+        # One scan over the text finds every synonym variant it contains
+        keywords = {
+            canonical_by_variant[match.group(1)]
+            for match in self._SYNONYM_RE.finditer(text.lower())
+        }
         
         return list(keywords)
     
@@ -508,39 +819,50 @@ class ContextAssembler:
     
     def _find_relevant_specs_ranked(self, keywords: List[str], max_results: int = 5) -> List[Dict]:
         """Find and rank specs by relevance."""
-        return self._rank_files_in_directory(
-            self.docs_dir / 'specs',
-            '*.md',
-            keywords,
-            max_results
-        )
+        return self._shared(('rank', 'specs', tuple(keywords), max_results),
+                            self._rank_group, 'specs', keywords, max_results)
     
     def _find_relevant_wiki_ranked(self, keywords: List[str], max_results: int = 3) -> List[Dict]:
         """Find and rank wiki files."""
-        return self._rank_files_in_directory(
-            self.docs_dir / 'wiki',
-            '*.md',
-            keywords,
-            max_results
-        )
+        return self._shared(('rank', 'wiki', tuple(keywords), max_results),
+                            self._rank_group, 'wiki', keywords, max_results)
     
     def _find_relevant_code_ranked(self, keywords: List[str], max_results: int = 5) -> List[Dict]:
         """Find and rank code files."""
-        all_results = []
-        for code_dir in ['processing', 'utils', 'scripts']:
-            code_path = self.project_root / code_dir
-            if code_path.exists():
-                results = self._rank_files_in_directory(
-                    code_path,
-                    '*.py',
-                    keywords,
-                    max_results
-                )
-                all_results.extend(results)
+        return self._shared(('rank', 'code', tuple(keywords), max_results),
+                            self._rank_group, 'code', keywords, max_results)
+    
+    def _rank_group(self, group: str, keywords: List[str], max_results: int) -> List[Dict]:
+        """Rank 'specs', 'wiki' or 'code' files: by embedding if available, else by keywords."""
+        ranked = self._rank_by_embedding(group, keywords, max_results)
+        if ranked is not None:
+            return ranked
+        
+        if group != 'code':
+            return self._rank_files_in_directory(
+                self.docs_dir / group,
+                '*.md',
+                keywords,
+                max_results
+            )
+        
+        return self._rank_files(self._enumerate_code_files(), keywords, max_results)
+    
+    def _enumerate_code_files(self) -> List[Path]:
+        """
+        Python files of all CODE_DIRS, in one listing.
         
-        # Sort all and return top N
-        all_results.sort(key=lambda x: x['score'], reverse=True)
-        return all_results[:max_results]
+        Cached per the directories' mtimes, so repeated assemblies skip the
+        directory scans until a file is added, removed or renamed.
+        """
+        directories = []
+        for code_dir in CODE_DIRS:
+            code_path = self.project_root / code_dir
+            try:
+                directories.append((str(code_path), code_path.stat().st_mtime_ns))
+            except OSError:
+                continue
+        return [Path(path) for path in _list_files_cached(tuple(directories), '.py')]
     
     def _rank_files_in_directory(
         self, 
@@ -549,51 +871,334 @@ class ContextAssembler:
         keywords: List[str],
         max_results: int
     ) -> List[Dict]:
-        """Rank files in a directory by keyword relevance."""
-        results = []
+        """
+        Rank files in a directory by keyword relevance.
         
+        See _rank_files for the result format.
+        """
         if not directory.exists():
-            return results
+            return []
+        return self._rank_files(list(directory.glob(pattern)), keywords, max_results)
+    
+    def _rank_files(self, file_paths: List[Path], keywords: List[str], max_results: int) -> List[Dict]:
+        """
+        Rank files by keyword relevance.
+        
+        Each returned result also carries a FilePayload ('payload') with the
+        content already in memory and its tag names, and the file's
+        'size_kb' and 'last_modified' from the stat made while reading it,
+        so callers can pass them on to _add_file_with_metadata instead of
+        reading and stat'ing the file again.
+        """
+        texts = {}
+        
+        # ASCII keywords (the usual case) are matched on raw bytes: reading
+        # skips UTF-8 decoding and bytes.lower() is far cheaper than
+        # str.lower(). Only files that score are decoded afterwards.
+        match_bytes = all(keyword.isascii() for keyword in keywords)
+        if match_bytes:
+            needles = [keyword.encode('ascii') for keyword in keywords]
+            read = self._read_bytes_or_none
+        else:
+            needles = keywords
+            read = self._read_file_or_none
+        
+        def score_files(indices: List[int]):
+            """Read and score file_paths[i] for each index, collecting results."""
+            paths = [file_paths[i] for i in indices]
+            
+            # Reads are I/O-bound (the GIL is released), so they overlap on
+            # a thread pool; scoring below stays serial
+            if len(paths) > 1:
+                contents = list(executor.map(read, paths))
+            else:
+                contents = [read(file_path) for file_path in paths]
+            
+            for index, file_path, content in zip(indices, paths, contents):
+                if content is None:
+                    # File unreadable or binary - skip to next file
+                    continue
+                
+                # Calculate score
+                score, matched_keywords = _keyword_score(
+                    content.lower(), file_path.name.lower(), keywords, needles
+                )
+                
+                if score > 0:
+                    # Non-UTF-8 files are skipped, as when matching decoded text;
+                    # decoding through the content cache also primes it for the
+                    # tag extraction and output that follow for ranked files
+                    read_result = self._read_file_with_stat(file_path)
+                    if read_result is None:
+                        continue
+                    text, stat = read_result
+                    size_kb, modified = self._stat_metadata(stat)
+                    rel_path = self._relative(file_path)
+                    texts[rel_path] = (text, stat.st_mtime_ns)
+                    scored.append((index, {
+                        'path': rel_path,
+                        'score': score,
+                        'keywords': matched_keywords,
+                        'reason': f"Matched {len(matched_keywords)} keywords: {', '.join(matched_keywords)}",
+                        'size_kb': size_kb,
+                        'last_modified': modified
+                    }))
+        
+        # Files whose name matches a keyword are scored first. Content adds
+        # at most 10 per keyword, so once max_results of them score above
+        # that, no file without a name match can reach the top N and the
+        # rest are never read.
+        scored = []
+        name_matches = [
+            index for index, file_path in enumerate(file_paths)
+            if any(keyword in file_path.name.lower() for keyword in keywords)
+        ]
+        content_cap = 10 * len(keywords)
+        
+        # Threads are started lazily, only for phases with several reads
+        with ThreadPoolExecutor(max_workers=RANK_READ_THREADS) as executor:
+            score_files(name_matches)
+            
+            if not (max_results and len(scored) >= max_results
+                    and heapq.nlargest(max_results, (result['score'] for _, result in scored))[-1] > content_cap):
+                name_matched = set(name_matches)
+                score_files([index for index in range(len(file_paths)) if index not in name_matched])
+        
+        # Back in file order, so ties rank exactly as in one pass
+        scored.sort(key=lambda item: item[0])
+        results = [result for _, result in scored]
+        
+        # Top N by score (nlargest keeps sort order for ties)
+        results = heapq.nlargest(max_results, results, key=lambda x: x['score'])
+        
+        # Payloads (and tags) only for the files that made the cut
+        for result in results:
+            text, mtime_ns = texts[result['path']]
+            result['payload'] = FilePayload(
+                path=result['path'],
+                content=text,
+                tags=_TAG_NAME_RE.findall(text),
+                mtime_ns=mtime_ns
+            )
+        return results
+    
+    # ========================================================================
+    # EMBEDDING RANKING
+    # ========================================================================
+    
+    def _corpus_files(self) -> List[Tuple[str, Path]]:
+        """(group, path) of every file the rankers choose from."""
+        sources = [
+            ('specs', self.docs_dir / 'specs', '*.md'),
+            ('wiki', self.docs_dir / 'wiki', '*.md'),
+        ]
+        sources += [('code', self.project_root / code_dir, '*.py')
+                    for code_dir in CODE_DIRS]
+        
+        files = []
+        for group, directory, pattern in sources:
+            if directory.exists():
+                files.extend((group, file_path) for file_path in sorted(directory.glob(pattern)))
+        return files
+    
+    def _load_corpus(self, reuse: bool = True):
+        """
+        Load (or build) the embedded file corpus.
+        
+        Only files added or modified since the corpus was saved are
+        embedded; with reuse=False every file is.
+        
+        Returns:
+            (int8 matrix, float32 row scales, relative paths, group per row);
+            row i of the normalized embedding matrix is matrix[i] * scales[i]
+        """
+        if self._corpus is not None:
+            return self._corpus
         
-        for file_path in directory.glob(pattern):
+        memory_dir = self.docs_dir / 'memory'
+        manifest_path = memory_dir / CORPUS_MANIFEST_FILE
+        
+        manifest = {'format': CORPUS_FORMAT, 'paths': [], 'groups': [], 'mtimes': []}
+        for group, file_path in self._corpus_files():
             try:
-                # Read file content for keyword matching
-                content = file_path.read_text(encoding='utf-8')
-            except (OSError, UnicodeDecodeError):
-                # File unreadable or binary - skip to next file
+                mtime_ns = file_path.stat().st_mtime_ns
+            except OSError:
                 continue
+            manifest['paths'].append(self._relative(file_path))
+            manifest['groups'].append(group)
+            manifest['mtimes'].append(mtime_ns)
+        
+        # The saved corpus is memory-mapped: an unchanged corpus costs a
+        # manifest read and two mmaps, and the pages are shared by every
+        # process that ranks in this project
+        try:
+            saved = json.loads(manifest_path.read_text(encoding='utf-8'))
+            generation = saved.pop('generation')
+            if saved.get('format') != CORPUS_FORMAT:
+                raise ValueError(f"corpus format {saved.get('format')!r}")
+            matrix = np.load(memory_dir / CORPUS_MATRIX_FILE.format(generation=generation), mmap_mode='r')
+            scales = np.load(memory_dir / CORPUS_SCALES_FILE.format(generation=generation), mmap_mode='r')
+            if len(matrix) != len(saved['paths']) or len(scales) != len(matrix):
+                saved = matrix = scales = None
+        except (OSError, ValueError, KeyError, AttributeError, TypeError):
+            saved = matrix = scales = None
+        if not reuse:
+            saved = None
+        
+        if saved != manifest:
+            # Re-embed only files that are new or changed since the save
+            saved_rows = {}
+            if saved is not None:
+                saved_rows = {
+                    path: (row, mtime_ns)
+                    for row, (path, mtime_ns) in enumerate(zip(saved['paths'], saved['mtimes']))
+                }
+            reused = {}
+            stale = []
+            for index, (rel_path, mtime_ns) in enumerate(zip(manifest['paths'], manifest['mtimes'])):
+                row, saved_mtime_ns = saved_rows.get(rel_path, (None, None))
+                if row is not None and saved_mtime_ns == mtime_ns:
+                    reused[index] = row
+                else:
+                    stale.append(index)
             
-            # Calculate score
-            score = 0
-            matched_keywords = []
-            filename_lower = file_path.name.lower()
-            content_lower = content.lower()
+            logger.info(f"Embedding {len(stale)} of {len(manifest['paths'])} files for ranking...")
+            texts = []
+            for index in stale:
+                try:
+                    texts.append(self._read_file(self.project_root / manifest['paths'][index])[:CORPUS_TEXT_CHARS])
+                except (OSError, UnicodeDecodeError):
+                    texts.append('')
+            embedded = np.asarray(self.dual_memory.embed_texts(texts) if texts else [], dtype=np.float32)
+            if embedded.ndim != 2 or len(embedded) != len(texts):
+                embedded = np.zeros((len(texts), 0), dtype=np.float32)
+            norms = np.linalg.norm(embedded, axis=1, keepdims=True)
+            embedded /= np.where(norms > 0, norms, 1.0)
+            embedded, embedded_scales = self._quantize_rows(embedded)
             
-            for keyword in keywords:
-                # Filename match (higher weight)
-                if keyword in filename_lower:
-                    score += 10
-                    matched_keywords.append(keyword)
-                
-                # Content matches
-                content_matches = content_lower.count(keyword)
-                if content_matches > 0:
-                    score += min(content_matches, 10)  # Cap at 10
-                    if keyword not in matched_keywords:
-                        matched_keywords.append(keyword)
+            # Saved rows from another embedding model (other dimension)
+            # can't be mixed in: embed everything again
+            if texts and reused and embedded.shape[1] != matrix.shape[1]:
+                return self._load_corpus(reuse=False)
             
-            if score > 0:
-                rel_path = str(file_path.relative_to(self.project_root))
-                results.append({
-                    'path': rel_path,
-                    'score': score,
-                    'keywords': matched_keywords,
-                    'reason': f"Matched {len(matched_keywords)} keywords: {', '.join(matched_keywords)}"
-                })
+            dim = embedded.shape[1] if texts else (matrix.shape[1] if matrix is not None else 0)
+            new_matrix = np.zeros((len(manifest['paths']), dim), dtype=np.int8)
+            new_scales = np.zeros(len(manifest['paths']), dtype=np.float32)
+            if reused:
+                indices = np.fromiter(reused.keys(), dtype=np.intp, count=len(reused))
+                rows = np.fromiter(reused.values(), dtype=np.intp, count=len(reused))
+                new_matrix[indices] = matrix[rows]
+                new_scales[indices] = scales[rows]
+            if stale:
+                new_matrix[stale] = embedded
+                new_scales[stale] = embedded_scales
+            matrix, scales = new_matrix, new_scales
+            self._save_corpus(memory_dir, manifest, matrix, scales)
+        
+        self._corpus = (matrix, scales, manifest['paths'], np.asarray(manifest['groups']))
+        return self._corpus
+    
+    @staticmethod
+    def _save_corpus(memory_dir: Path, manifest: Dict, matrix, scales):
+        """
+        Persist the corpus so concurrent readers always see one consistent save.
+        
+        The arrays go to files named after a generation id (hash of the
+        manifest and the row scales) and the manifest naming that id is
+        renamed into place last: a reader gets either the previous
+        generation or this one, never a mix. Older generations are removed,
+        except the one just replaced, which a reader may be about to open.
+        """
+        digest = hashlib.sha256(json.dumps(manifest).encode('utf-8'))
+        digest.update(scales.tobytes())
+        generation = digest.hexdigest()[:16]
+        
+        memory_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = memory_dir / CORPUS_MANIFEST_FILE
+        try:
+            previous = json.loads(manifest_path.read_text(encoding='utf-8')).get('generation')
+        except (OSError, ValueError, AttributeError):
+            previous = None
+        
+        for template, array in ((CORPUS_MATRIX_FILE, matrix), (CORPUS_SCALES_FILE, scales)):
+            path = memory_dir / template.format(generation=generation)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                np.save(f, array)
+            os.replace(tmp_path, path)
         
-        # Sort by score
-        results.sort(key=lambda x: x['score'], reverse=True)
-        return results[:max_results]
+        tmp_path = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({**manifest, 'generation': generation}), encoding='utf-8')
+        os.replace(tmp_path, manifest_path)
+        
+        # Unlinking is safe for processes that already mapped a file
+        keep = {generation, previous}
+        for template in (CORPUS_MATRIX_FILE, CORPUS_SCALES_FILE):
+            for path in memory_dir.glob(template.format(generation='*')):
+                if path.name not in {template.format(generation=g) for g in keep}:
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+    
+    @staticmethod
+    def _quantize_rows(matrix):
+        """Symmetric per-row int8 quantization: matrix ~= int8_rows * scales[:, None]."""
+        scales = np.abs(matrix).max(axis=1, initial=0.0) / 127
+        safe_scales = np.where(scales > 0, scales, 1.0)
+        quantized = np.round(matrix / safe_scales[:, None]).astype(np.int8)
+        return quantized, scales.astype(np.float32)
+    
+    def _rank_by_embedding(self, group: str, keywords: List[str],
+                           max_results: int) -> Optional[List[Dict]]:
+        """
+        Rank one group of corpus files by cosine similarity to the keywords.
+        
+        One matrix-vector product scores every file, instead of reading
+        and substring-counting each of them per query.
+        
+        Returns:
+            Ranked results in _rank_files_in_directory's format, or None
+            when embeddings are unavailable (callers fall back to keywords)
+        """
+        if not (self.use_semantic and HAS_NUMPY) or self._corpus_failed:
+            return None
+        if not keywords:
+            return []
+        
+        try:
+            matrix, scales, paths, groups = self._load_corpus()
+            query = np.asarray(self.dual_memory.embed_query(' '.join(keywords)), dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"Embedding ranking unavailable, using keyword ranking: {e}")
+            self._corpus_failed = True
+            return None
+        
+        norm = float(np.linalg.norm(query))
+        if norm == 0 or query.shape[0] != matrix.shape[1]:
+            return None
+        
+        rows = np.flatnonzero(groups == group)
+        top_k = min(max_results, len(rows))
+        if top_k == 0:
+            return []
+        # int8 rows are widened only for the product (numpy has no int8
+        # GEMM); the query stays float32, so only the corpus side is quantized
+        scores = (matrix[rows].astype(np.float32) @ (query / norm)) * scales[rows]
+        
+        # Top-k without sorting every score
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+        top = top[np.argsort(-scores[top])]
+        
+        return [
+            {
+                'path': paths[rows[i]],
+                'score': round(float(scores[i]) * 100, 1),  # Callers divide by 100
+                'keywords': [],
+                'reason': f"Embedding similarity {scores[i]:.3f} to: {', '.join(keywords)}"
+            }
+            for i in top if scores[i] > 0
+        ]
     
     # ========================================================================
     # ADAPTIVE TAG EXTRACTION
@@ -606,15 +1211,14 @@ class ContextAssembler:
             full_path = self.project_root / file_path
             
             # Read entire file content for tag extraction
-            content = full_path.read_text(encoding='utf-8')
+            content = self._read_file(full_path)
             
         except (OSError, UnicodeDecodeError) as e:
             # File unreadable or has encoding issues
             return {'strategy': 'error', 'content': f'(Could not read file: {e})'}
         
         # Extract all tags
-        tag_pattern = r'<!--TAG:([a-zA-Z0-9_]+)-->(.*?)<!--/TAG:\1-->'
-        tags = list(re.finditer(tag_pattern, content, re.DOTALL))
+        tags = list(_TAG_RE.finditer(content))
         
         if not tags:
             # No tags - return full file with warning
@@ -642,17 +1246,18 @@ class ContextAssembler:
                 }
         
         elif len(tags) > 5:
-            # Too many tags - prioritize by relevance
+            # Too many tags - prioritize by relevance. Keywords are lowered
+            # and deduplicated once, so a keyword given in two spellings
+            # ('Memory', 'memory') counts once per tag
+            keywords_lower = frozenset(keyword.lower() for keyword in self.current_keywords)
             scored_tags = []
             for tag in tags:
                 tag_name = tag.group(1)
                 tag_content = tag.group(2).strip()
                 
-                # Score by keyword match
-                score = 0
-                for keyword in self.current_keywords:
-                    if keyword.lower() in tag_content.lower():
-                        score += 1
+                # Score by keyword match (one lowercased copy per tag)
+                tag_content_lower = tag_content.lower()
+                score = sum(1 for keyword in keywords_lower if keyword in tag_content_lower)
                 
                 scored_tags.append({
                     'name': tag_name,
@@ -686,14 +1291,8 @@ class ContextAssembler:
             # Resolve full path from project root
             full_path = self.project_root / file_path
             
-            # Read file content for tag extraction
-            content = full_path.read_text(encoding='utf-8')
-            
-            # Regex pattern to find opening semantic tags
-            tag_pattern = r'<!--TAG:([a-zA-Z0-9_]+)-->'
-            
-            # Extract all tag identifiers from file
-            tags = re.findall(tag_pattern, content)
+            # Tag names are cached alongside the file content
+            tags = list(_tag_names_cached(str(full_path), full_path.stat().st_mtime_ns))
             
         except (OSError, UnicodeDecodeError):
             # File unreadable - return empty tags list
@@ -704,6 +1303,15 @@ class ContextAssembler:
     # HELPER METHODS
     # ========================================================================
     
+    def _read_file(self, full_path: Path) -> str:
+        """
+        Read a file as UTF-8 through the (path, mtime) content cache.
+        
+        Raises:
+            OSError, UnicodeDecodeError: as Path.read_text() would
+        """
+        return _read_text_cached(str(full_path), full_path.stat().st_mtime_ns)
+    
     def _add_file_with_metadata(
         self,
         package: ContextPackage,
@@ -712,9 +1320,18 @@ class ContextAssembler:
         score: float,
         content_type: str,
         keywords: List[str] = None,
-        line_range: Tuple[int, int] = None
+        line_range: Tuple[int, int] = None,
+        payload: Optional[FilePayload] = None,
+        size_kb: Optional[float] = None,
+        last_modified: Optional[str] = None
     ):
-        """Add file to package with metadata."""
+        """
+        Add file to package with metadata.
+        
+        Pass payload, size_kb and last_modified when the caller already has
+        them (e.g. from ranking); otherwise they are taken from the file.
+        The payload's content is kept for generate_context_file.
+        """
         if not file_path:
             return
         
@@ -723,18 +1340,18 @@ class ContextAssembler:
             if package.file_metadata[file_path].relevance_score >= score:
                 return
         
-        # Get file stats
-        full_path = self.project_root / file_path
-        try:
-            stat = full_path.stat()
-            size_kb = round(stat.st_size / 1024, 2)
-            modified = datetime.fromtimestamp(stat.st_mtime).isoformat()
-        except:
-            size_kb = 0
-            modified = "unknown"
+        # Get file stats (unless the caller already has them)
+        if size_kb is not None and last_modified is not None:
+            modified = last_modified
+        else:
+            size_kb, modified = self._shared(('file_stat', file_path), self._file_stat, file_path)
         
-        # Extract tags
-        tags = self._extract_tags_from_file(file_path)
+        # Extract tags (unless the caller already has them)
+        if payload is not None:
+            tags = payload.tags
+            package.payloads[file_path] = payload
+        else:
+            tags = self._shared(('tags', file_path), self._extract_tags_from_file, file_path)
         
         # Create metadata
         metadata = FileMetadata(
@@ -750,22 +1367,27 @@ class ContextAssembler:
         )
         package.file_metadata[file_path] = metadata
         
-        # Add to appropriate list
-        if content_type == 'readme':
-            if file_path not in package.readme_files:
-                package.readme_files.append(file_path)
-        elif content_type == 'spec':
-            if file_path not in package.spec_files:
-                package.spec_files.append(file_path)
-        elif content_type == 'wiki':
-            if file_path not in package.wiki_files:
-                package.wiki_files.append(file_path)
-        elif content_type == 'code':
-            if file_path not in package.code_files:
-                package.code_files.append(file_path)
-        elif content_type == 'dependency':
-            if file_path not in package.dependency_maps:
-                package.dependency_maps.append(file_path)
+        # Add to appropriate list (once per list; the set keeps the
+        # membership test O(1) as the lists grow)
+        list_name = _PACKAGE_LIST_BY_CONTENT_TYPE.get(content_type)
+        if list_name and (content_type, file_path) not in package.listed:
+            package.listed.add((content_type, file_path))
+            getattr(package, list_name).append(file_path)
+    
+    def _file_stat(self, file_path: str) -> Tuple[float, str]:
+        """(size in KB, ISO modification time) of a project file."""
+        full_path = self.project_root / file_path
+        try:
+            return self._stat_metadata(full_path.stat())
+        except OSError:
+            return 0, "unknown"
+    
+    @staticmethod
+    def _stat_metadata(stat: os.stat_result) -> Tuple[float, str]:
+        """(size in KB, ISO modification time) from a stat result."""
+        size_kb = round(stat.st_size / 1024, 2)
+        modified = datetime.fromtimestamp(stat.st_mtime).isoformat()
+        return size_kb, modified
     
     def _find_dependency_map(self, file_path: str) -> Optional[str]:
         """Find dependency map for a file."""
@@ -776,14 +1398,54 @@ class ContextAssembler:
             return str(dep_file.relative_to(self.project_root))
         return None
     
+    def _relative(self, file_path: Path) -> str:
+        """Path of a file found under project_root, relative to it."""
+        return os.fspath(file_path).removeprefix(self._root_prefix)
+    
+    def _read_bytes_or_none(self, full_path: Path) -> Optional[bytes]:
+        """Raw file content, or None if the file can't be read."""
+        try:
+            return full_path.read_bytes()
+        except OSError:
+            return None
+    
+    def _read_file_or_none(self, full_path: Path) -> Optional[str]:
+        """_read_file(), returning None for unreadable or non-UTF-8 files."""
+        try:
+            return self._read_file(full_path)
+        except (OSError, UnicodeDecodeError):
+            return None
+    
+    def _read_file_with_stat(self, full_path: Path) -> Optional[Tuple[str, os.stat_result]]:
+        """
+        (content, stat) of a file read through the content cache, or None
+        for unreadable or non-UTF-8 files; one stat serves both the cache
+        key and the file's metadata.
+        """
+        try:
+            stat = full_path.stat()
+            return _read_text_cached(str(full_path), stat.st_mtime_ns), stat
+        except (OSError, UnicodeDecodeError):
+            return None
+    
+    def _count_files(self, directory: Path, suffix: str) -> int:
+        """
+        Count files with a suffix in a directory (0 if it doesn't exist).
+        
+        Cached per directory mtime: adding, removing or renaming an entry
+        updates the mtime, so counts stay correct across assemblies.
+        """
+        try:
+            mtime_ns = directory.stat().st_mtime_ns
+            return _count_files_cached(str(directory), mtime_ns, suffix)
+        except OSError:
+            return 0
+    
     def _generate_project_tree(self) -> str:
         """Generate project structure summary."""
-        try:
-            spec_count = len(list((self.docs_dir / 'specs').glob('*.md'))) if (self.docs_dir / 'specs').exists() else 0
-            wiki_count = len(list((self.docs_dir / 'wiki').glob('*.md'))) if (self.docs_dir / 'wiki').exists() else 0
-            automation_count = len(list((self.docs_dir / 'automation').glob('*.py'))) if (self.docs_dir / 'automation').exists() else 0
-        except:
-            spec_count = wiki_count = automation_count = 0
+        spec_count = self._count_files(self.docs_dir / 'specs', '.md')
+        wiki_count = self._count_files(self.docs_dir / 'wiki', '.md')
+        automation_count = self._count_files(self.docs_dir / 'automation', '.py')
         
         return f"""## Project Structure
 
@@ -813,91 +1475,99 @@ class ContextAssembler:
     # ========================================================================
     
     def generate_context_file(self, package: ContextPackage, output_path: Path):
-        """Generate context file with rich metadata."""
-        lines = []
-        
-        # Header with stats
-        lines.append("# Context Assembly Report\n")
-        lines.append(f"**Task**: {package.task_description}")
-        lines.append(f"**Strategy**: {package.search_strategy}")
-        lines.append(f"**Total files**: {len(package.file_metadata)}")
-        lines.append(f"**Assembly time**: {package.assembly_stats.get('time_seconds', 0):.3f}s")
-        lines.append(f"**Timestamp**: {package.assembly_stats.get('timestamp', 'N/A')}")
-        if package.assembly_stats.get('keywords_used'):
-            lines.append(f"**Keywords**: {', '.join(package.assembly_stats['keywords_used'])}")
-        lines.append("\n" + "=" * 60 + "\n")
-        
-        # Project structure
-        if package.project_tree:
-            lines.append(package.project_tree)
-            lines.append("\n" + "=" * 60 + "\n")
-        
-        # Files sorted by score
-        sorted_files = sorted(
-            package.file_metadata.items(),
-            key=lambda x: x[1].relevance_score,
-            reverse=True
-        )
+        """
+        Generate context file with rich metadata.
         
-        for i, (file_path, metadata) in enumerate(sorted_files, 1):
-            lines.append(f"## {i}. {Path(file_path).name} (Score: {metadata.relevance_score})")
-            lines.append("")
-            lines.append(f"**Path**: `{file_path}`")
-            lines.append(f"**Type**: {metadata.content_type}")
-            lines.append(f"**Why included**: {metadata.reason}")
-            
-            if metadata.matched_keywords:
-                lines.append(f"**Matched keywords**: {', '.join(metadata.matched_keywords)}")
+        The report is streamed to output_path line by line (through a 1 MiB
+        write buffer) instead of being collected in memory and joined.
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
+            write = f.write
             
-            lines.append(f"**File size**: {metadata.file_size_kb} KB")
-            lines.append(f"**Last modified**: {metadata.last_modified}")
+            def emit(text: str):
+                """Write one report line (lines are newline-separated)."""
+                write('\n')
+                write(text)
             
-            if metadata.tags:
-                lines.append(f"**Tags**: {', '.join(f'`{t}`' for t in metadata.tags[:5])}")
+            # Header with stats
+            write("# Context Assembly Report\n")
+            emit(f"**Task**: {package.task_description}")
+            emit(f"**Strategy**: {package.search_strategy}")
+            emit(f"**Total files**: {len(package.file_metadata)}")
+            emit(f"**Assembly time**: {package.assembly_stats.get('time_seconds', 0):.3f}s")
+            emit(f"**Timestamp**: {package.assembly_stats.get('timestamp', 'N/A')}")
+            if package.assembly_stats.get('keywords_used'):
+                emit(f"**Keywords**: {', '.join(package.assembly_stats['keywords_used'])}")
+            emit("\n" + "=" * 60 + "\n")
             
-            if metadata.line_range:
-                lines.append(f"**Lines**: {metadata.line_range[0]}-{metadata.line_range[1]}")
+            # Project structure
+            if package.project_tree:
+                emit(package.project_tree)
+                emit("\n" + "=" * 60 + "\n")
             
-            lines.append("\n**Content**:\n")
+            # Files sorted by score
+            sorted_files = sorted(
+                package.file_metadata.items(),
+                key=lambda x: x[1].relevance_score,
+                reverse=True
+            )
             
-            # Include file content with adaptive tag handling
-            try:
-                full_path = self.project_root / file_path
-                if file_path.endswith('.json'):
-                    lines.append("```json")
-                elif file_path.endswith('.py'):
-                    lines.append("```python")
-                else:
-                    lines.append("```markdown")
+            for i, (file_path, metadata) in enumerate(sorted_files, 1):
+                emit(f"## {i}. {Path(file_path).name} (Score: {metadata.relevance_score})")
+                emit("")
+                emit(f"**Path**: `{file_path}`")
+                emit(f"**Type**: {metadata.content_type}")
+                emit(f"**Why included**: {metadata.reason}")
+                
+                if metadata.matched_keywords:
+                    emit(f"**Matched keywords**: {', '.join(metadata.matched_keywords)}")
+                
+                emit(f"**File size**: {metadata.file_size_kb} KB")
+                emit(f"**Last modified**: {metadata.last_modified}")
+                
+                if metadata.tags:
+                    emit(f"**Tags**: {', '.join(f'`{t}`' for t in metadata.tags[:5])}")
+                
+                if metadata.line_range:
+                    emit(f"**Lines**: {metadata.line_range[0]}-{metadata.line_range[1]}")
+                
+                emit("\n**Content**:\n")
+                
+                # Include file content with adaptive tag handling
+                try:
+                    full_path = self.project_root / file_path
+                    if file_path.endswith('.json'):
+                        emit("```json")
+                    elif file_path.endswith('.py'):
+                        emit("```python")
+                    else:
+                        emit("```markdown")
                 
-                content = full_path.read_text(encoding='utf-8')
+                    payload = package.payloads.get(file_path)
+                    content = payload.content if payload is not None else self._read_file(full_path)
                 
-                # Truncate very long files
-                max_chars = 8000
-                if len(content) > max_chars:
-                    content = content[:max_chars] + f"\n\n... (truncated, {len(content)} total chars)"
+                    # Truncate very long files
+                    max_chars = 8000
+                    if len(content) > max_chars:
+                        content = content[:max_chars] + f"\n\n... (truncated, {len(content)} total chars)"
                 
-                lines.append(content)
-                lines.append("```")
-            except Exception as e:
-                lines.append(f"(Could not read file: {e})")
+                    emit(content)
+                    emit("```")
+                except Exception as e:
+                    emit(f"(Could not read file: {e})")
+                
+                emit("\n" + "-" * 60 + "\n")
             
-            lines.append("\n" + "-" * 60 + "\n")
-        
-        # Tags summary
-        all_tags = set()
-        for metadata in package.file_metadata.values():
-            all_tags.update(metadata.tags)
-        
-        if all_tags:
-            lines.append("## Related Tags\n")
-            for tag in sorted(all_tags)[:20]:
-                lines.append(f"- `<!--TAG:{tag}-->`")
-        
-        # Write file
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+            # Tags summary
+            all_tags = set()
+            for metadata in package.file_metadata.values():
+                all_tags.update(metadata.tags)
+            
+            if all_tags:
+                emit("## Related Tags\n")
+                for tag in sorted(all_tags)[:20]:
+                    emit(f"- `<!--TAG:{tag}-->`")
         
         logger.info(f"Context saved to: {output_path}")
 
@@ -26,6 +26,7 @@ DEPENDENCIES (Quick Reference):
     Data:
         - Input: Python files to analyze
         - Output: Modified files with injected tags (--apply mode)
+        - Cache: docs/memory/.ast_tagger_cache.sqlite (per-file structure, see automation._dep_cache)
     External:
         - None (fully self-contained)
 
@@ -33,6 +34,7 @@ USAGE:
     python3 ast_auto_tagger.py --file path/to/file.py --preview
     python3 ast_auto_tagger.py --directory utils/ --apply
     python3 ast_auto_tagger.py --all --report
+    python3 ast_auto_tagger.py --all --report --workers 4
     python3 ast_auto_tagger.py --file script.py --json
 
 RECENT CHANGES:
@@ -47,10 +49,14 @@ import re
 import sys
 import ast
 import yaml
+import pickle
+import sqlite3
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Set, Optional, Tuple
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 # Add project root to path
 # Add project root to Python path for portable imports
@@ -65,19 +71,59 @@ except ImportError:
     logger = logging.getLogger("ast_auto_tagger")
     logging.basicConfig(level=logging.INFO)
 
+from automation._dep_cache import DependencyCache
 
-@dataclass
+# Version of the cached per-file structure; bump when extraction changes.
+# The Python version is part of it because it decides what ast.parse accepts.
+STRUCTURE_VERSION = f"1-py{sys.version_info[0]}.{sys.version_info[1]}"
+
+# Leading characters of a file scanned for docstring features
+DOCSTRING_AREA_CHARS = 2000
+
+# Existing tag, on raw bytes, and how much of a file has_existing_tags reads
+_TAG_BYTES_RE = re.compile(rb'<!--TAG:[a-zA-Z0-9_:]+-->')
+TAG_HEAD_BYTES = 8192
+
+# Tag block written by generate_tag_block
+_TAG_BLOCK = "<!--TAG:{primary}-->\n\nTAGS: {inline}\n\n<!--/TAG:{primary}-->"
+
+# apply_tags inserts after the leading run of header lines: a shebang, a
+# line mentioning 'coding' (encoding declaration), or a blank line
+_HEADER_LINE = r'(?:#![^\n]*|[^\n]*coding[^\n]*|[^\S\n]*)'
+_HEADER_LINE_RE = re.compile(_HEADER_LINE)
+_HEADER_RE = re.compile(rf'(?:{_HEADER_LINE}\n)*')
+
+# Component directories, in order of precedence when a path has several
+COMPONENTS = ('automation', 'utils', 'processing', 'tests', 'docs')
+
+# Default structure cache, relative to the project root
+DEFAULT_CACHE_PATH = Path('docs') / 'memory' / '.ast_tagger_cache.sqlite'
+
+
+@lru_cache(maxsize=None)
+def _load_schema_cached(schema_path: str) -> Dict:
+    """Parse a tag schema once per process ({} if missing or invalid)."""
+    path = Path(schema_path)
+    if path.exists():
+        try:
+            return yaml.safe_load(path.read_text())
+        except Exception as e:
+            logger.warning(f"Could not load schema: {e}")
+    return {}
+
+
+@dataclass(slots=True)
 class TagSuggestion:
-    """A suggested tag with confidence score."""
+    """A suggested tag with confidence score (slotted: no per-instance __dict__)."""
     tag: str
     confidence: float  # 0.0 - 1.0
     reason: str
     source: str  # path, import, name, content
 
 
-@dataclass 
+@dataclass(slots=True)
 class FileTagAnalysis:
-    """Complete tag analysis for a file."""
+    """Complete tag analysis for a file (slotted; requires Python 3.10+)."""
     file_path: str
     existing_tags: List[str] = field(default_factory=list)
     suggested_tags: List[TagSuggestion] = field(default_factory=list)
@@ -85,6 +131,8 @@ class FileTagAnalysis:
     classes_found: List[str] = field(default_factory=list)
     functions_found: List[str] = field(default_factory=list)
     imports_found: List[str] = field(default_factory=list)
+    # Decoded source as analyzed, kept for apply_tags (keep_content taggers)
+    content: Optional[str] = field(default=None, repr=False)
 
 
 class ASTAutoTagger:
@@ -99,12 +147,77 @@ class ASTAutoTagger:
     - Features from imports and names
     """
     
-    def __init__(self, schema_path: Optional[Path] = None):
+    # Feature maps, built once per class rather than on every call. Plain
+    # substring tests are kept: each `in` is a C-level search of a short
+    # string, which measured several times faster than one alternation
+    # regex (scanned with a lookahead at every position) per string
+    
+    # Map import patterns to features (first matching pattern wins)
+    IMPORT_FEATURES = {
+        'embed': ('embeddings', 'imports embedding-related module'),
+        'search': ('search', 'imports search-related module'),
+        'valid': ('validation', 'imports validation-related module'),
+        'logging': ('logging', 'imports logging module'),
+        'log': ('logging', 'imports logging-related module'),
+        'memory': ('memory', 'imports memory-related module'),
+        'llm': ('llm', 'imports LLM-related module'),
+        'openai': ('llm', 'imports OpenAI'),
+        'anthropic': ('llm', 'imports Anthropic'),
+        'vllm': ('llm', 'imports vLLM'),
+        'ast': ('validation', 'uses AST parsing'),
+        'yaml': ('config', 'uses YAML configuration'),
+        'json': ('config', 'uses JSON configuration'),
+    }
+    
+    # Map class/function name patterns to features (first matching pattern wins)
+    NAME_FEATURES = {
+        'validator': ('validation', 'Validator class/function found'),
+        'validate': ('validation', 'validate function found'),
+        'search': ('search', 'Search class/function found'),
+        'embed': ('embeddings', 'Embed class/function found'),
+        'tagger': ('tagging', 'Tagger class/function found'),
+        'tag': ('tagging', 'tag-related function found'),
+        'logger': ('logging', 'Logger class found'),
+        'memory': ('memory', 'Memory class found'),
+        'index': ('indexing', 'Index class/function found'),
+        'context': ('context', 'Context class/function found'),
+        'assembl': ('context', 'Assembler class/function found'),
+    }
+    
+    # Map docstring phrases to features (every matching phrase counts)
+    CONTENT_FEATURES = {
+        'embedding': ('embeddings', 'mentions embedding in documentation'),
+        'semantic search': ('search', 'mentions semantic search'),
+        'validation': ('validation', 'mentions validation'),
+        'pipeline': ('pipeline', 'mentions pipeline processing'),
+        'analytics': ('analytics', 'mentions analytics'),
+        'llm': ('llm', 'mentions LLM integration'),
+    }
+    
+    # (pattern, (feature, reason)) pairs in map order, for the scan loops
+    _IMPORT_PATTERNS = tuple(IMPORT_FEATURES.items())
+    _NAME_PATTERNS = tuple(NAME_FEATURES.items())
+    
+    # Suggested tag strings, formatted and interned once, so all analyses
+    # share one string object per tag (cheap to hash and compare)
+    _COMPONENT_TAGS = {component: sys.intern(f"component:{component}") for component in COMPONENTS}
+    _TYPE_TAGS = {type_tag: sys.intern(f"type:{type_tag}") for type_tag in ('class', 'script')}
+    _FEATURE_TAGS = {
+        feature: sys.intern(f"feature:{feature}")
+        for feature, _ in (*IMPORT_FEATURES.values(), *NAME_FEATURES.values(),
+                           *CONTENT_FEATURES.values())
+    }
+    
+    def __init__(self, schema_path: Optional[Path] = None,
+                 cache_path: Optional[Path] = None, keep_content: bool = False):
         """
         Initialize tagger with schema.
         
         Args:
             schema_path: Path to tag_schema.yaml for validation.
+            cache_path: SQLite structure cache; None disables caching.
+            keep_content: Keep each file's text in its analysis, so
+                          apply_tags doesn't read the file again.
         """
         # Find schema
         if schema_path is None:
@@ -112,23 +225,27 @@ class ASTAutoTagger:
         else:
             self.schema_path = Path(schema_path)
         
-        # Load schema if available
-        self.schema = self._load_schema()
-        
         # Tag patterns for existing tag detection
         self.tag_pattern = re.compile(r'<!--TAG:([a-zA-Z0-9_:]+)-->')
         self.close_pattern = re.compile(r'<!--/TAG:([a-zA-Z0-9_:]+)-->')
         
+        # Structure cache: existing tags, classes, functions and imports per
+        # (path, SHA-256 of the source), so unchanged files skip ast.parse
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.cache = DependencyCache(self.cache_path, STRUCTURE_VERSION) if cache_path else None
+        self.keep_content = keep_content
+        
         logger.info("ASTAutoTagger initialized")
     
-    def _load_schema(self) -> Dict:
-        """Load tag schema for validation."""
-        if self.schema_path.exists():
-            try:
-                return yaml.safe_load(self.schema_path.read_text())
-            except Exception as e:
-                logger.warning(f"Could not load schema: {e}")
-        return {}
+    @property
+    def schema(self) -> Dict:
+        """
+        Tag schema for validation, loaded on first use.
+        
+        Parsed once per process and path, so taggers (e.g. in pool
+        workers) share it; treat it as read-only.
+        """
+        return _load_schema_cached(str(self.schema_path))
     
     def analyze_file(self, file_path: Path) -> FileTagAnalysis:
         """
@@ -148,37 +265,45 @@ class ASTAutoTagger:
         # Step 1: Read file content with UTF-8 encoding
         logger.info(f"Analyzing file", {"path": str(file_path)})
         try:
-            # Read entire file content for parsing
-            content = file_path.read_text(encoding='utf-8')
+            # Read entire file content for parsing (raw bytes are the cache key)
+            source = file_path.read_bytes()
+            content = source.decode('utf-8')
         except Exception as e:
             # Log error and return empty analysis on read failure
             logger.error(f"Cannot read {file_path}: {e}")
             return analysis
+        if '\r' in content:
+            # Universal newlines, as read_text() would give
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        if self.keep_content:
+            analysis.content = content
         
-        # Step 2: Extract existing tags using regex pattern
-        # This finds all <!--TAG:xyz--> patterns already in the file
-        analysis.existing_tags = self.tag_pattern.findall(content)
+        # Steps 2-4: existing tags and AST structure (cached per source)
+        existing_tags, classes, functions, imports, syntax_error = \
+            self._cached_structure(file_path, source, content)
+        
+        analysis.existing_tags = existing_tags
         logger.info(f"Found existing tags", {"count": len(analysis.existing_tags)})
         
-        # Step 3: Parse file content into AST (Abstract Syntax Tree)
-        try:
-            # ast.parse() returns Module node as tree root
-            tree = ast.parse(content)
-        except SyntaxError as e:
+        if syntax_error is not None:
             # Files with syntax errors can't be analyzed further
-            logger.warning(f"Syntax error in {file_path}: {e}")
+            logger.warning(f"Syntax error in {file_path}: {syntax_error}")
             return analysis
         
-        # Step 4: Extract structural information from AST
-        # Each extraction walks the tree looking for specific node types
-        analysis.classes_found = self._extract_classes(tree)
-        analysis.functions_found = self._extract_functions(tree)
-        analysis.imports_found = self._extract_imports(tree)
+        analysis.classes_found = classes
+        analysis.functions_found = functions
+        analysis.imports_found = imports
+        
+        # Only the docstring area is needed from here on: lowercase just
+        # that slice (never shorter than the slice of the lowered file) and
+        # let the full text go
+        docstring_area = content[:DOCSTRING_AREA_CHARS].lower()[:DOCSTRING_AREA_CHARS]
+        del content, source
         
         # Step 5: Generate tag suggestions from multiple sources
         # Sources: path, structure, imports, names, content (different confidence)
         analysis.suggested_tags = self._generate_suggestions(
-            file_path, content, tree, analysis
+            file_path, docstring_area, analysis
         )
         
         # Step 6: Determine the primary identifier tag for this file
@@ -195,121 +320,160 @@ class ASTAutoTagger:
         return analysis
     # <!--/TAG:analyze_file:method-->
     
-    def _extract_classes(self, tree: ast.AST) -> List[str]:
-        """Extract all class names from AST."""
-        # Walk entire AST tree recursively to find all ClassDef nodes
-        # Returns list of class names (e.g., ['MyClass', 'BaseHandler'])
-        return [node.name for node in ast.walk(tree) 
-                if isinstance(node, ast.ClassDef)]
-    
-    def _extract_functions(self, tree: ast.AST) -> List[str]:
-        """Extract top-level function names from AST."""
-        # Only get direct children of module (not nested/method functions)
-        # iter_child_nodes only yields immediate children, not recursive
-        return [node.name for node in ast.iter_child_nodes(tree)
-                if isinstance(node, ast.FunctionDef)]
-    
-    def _extract_imports(self, tree: ast.AST) -> List[str]:
-        """Extract all import names from AST."""
+    def has_existing_tags(self, file_path: Path) -> bool:
+        """
+        Quick check for a semantic tag in the first TAG_HEAD_BYTES of a file.
+        
+        Scans raw bytes (no decoding, no AST). True means analyze_file would
+        report existing tags; False means none in the head only.
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                head = f.read(TAG_HEAD_BYTES)
+        except OSError:
+            return False
+        return _TAG_BYTES_RE.search(head) is not None
+    
+    def _cached_structure(self, file_path: Path, source: bytes, content: str) -> Tuple:
+        """
+        Existing tags and AST structure of a file, through the cache.
+        
+        Returns:
+            (existing_tags, classes, functions, imports, syntax_error);
+            syntax_error is the parse error message, or None
+        """
+        sha = None
+        if self.cache is not None:
+            try:
+                sha = self.cache.digest(source)
+                payload = self.cache.get(str(file_path), sha)
+                if payload is not None:
+                    return pickle.loads(payload)
+            except (sqlite3.Error, pickle.UnpicklingError, EOFError) as e:
+                logger.warning(f"Structure cache unavailable ({self.cache.db_path}): {e}")
+                self.cache = None
+        
+        # Step 2: Extract existing tags using regex pattern
+        # This finds all <!--TAG:xyz--> patterns already in the file
+        existing_tags = self.tag_pattern.findall(content)
+        
+        # Step 3: Parse file content into AST (Abstract Syntax Tree)
+        try:
+            # ast.parse() returns Module node as tree root (AST only, no
+            # type comments - the tagger never looks at either)
+            tree = ast.parse(content, filename=str(file_path), type_comments=False)
+        except SyntaxError as e:
+            structure = (existing_tags, [], [], [], str(e))
+        else:
+            # Step 4: Extract structural information from AST
+            structure = (existing_tags, *self._extract_structure(tree), None)
+        
+        if self.cache is not None:
+            try:
+                self.cache.put(str(file_path), sha, pickle.dumps(structure), file_path.stat().st_mtime)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Could not update structure cache ({self.cache.db_path}): {e}")
+        return structure
+    
+    def _extract_structure(self, tree: ast.Module) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Extract class, top-level function and import names in one pass.
+        
+        Returns:
+            (classes, functions, imports): every class name and import
+            source, in ast.walk() order, and the module's top-level
+            (non-async) function names
+        """
+        classes = []  # e.g. ['MyClass', 'BaseHandler'], nested ones included
         imports = []  # Accumulator for discovered import module names
+        ClassDef, Import, ImportFrom = ast.ClassDef, ast.Import, ast.ImportFrom
         
-        # Walk entire AST tree to find all import-related nodes
+        # One walk over the entire tree; exact type checks replace isinstance
         for node in ast.walk(tree):
+            node_type = type(node)
+            if node_type is ClassDef:
+                classes.append(node.name)
             # Handle 'import foo, bar' style imports
-            if isinstance(node, ast.Import):
-                # Import can have multiple names: 'import a, b, c'
-                for alias in node.names:
-                    # Add the module name (not the alias if 'import x as y')
-                    imports.append(alias.name)
+            elif node_type is Import:
+                # Add the module names (not the alias if 'import x as y')
+                imports.extend(alias.name for alias in node.names)
             # Handle 'from foo import bar' style imports
-            elif isinstance(node, ast.ImportFrom):
+            elif node_type is ImportFrom:
                 # node.module is None for relative imports like 'from . import x'
                 if node.module:
                     # Add the source module, not the imported names
                     imports.append(node.module)
         
-        return imports  # Return list of all discovered import sources
+        # Only direct children of the module (not nested/method functions)
+        functions = [node.name for node in tree.body if type(node) is ast.FunctionDef]
+        
+        return classes, functions, imports
     
-    def _generate_suggestions(self, file_path: Path, content: str,
-                               tree: ast.AST, analysis: FileTagAnalysis) -> List[TagSuggestion]:
-        """Generate tag suggestions based on analysis."""
-        suggestions = []
+    def _generate_suggestions(self, file_path: Path, docstring_area: str,
+                               analysis: FileTagAnalysis) -> List[TagSuggestion]:
+        """
+        Generate tag suggestions based on analysis.
+        
+        docstring_area is the lowercased start of the file (see
+        _detect_features_from_content).
+        """
+        # One suggestion per tag, keeping the highest confidence (the first
+        # one on ties), deduplicated as suggestions are made
+        seen_tags = {}
+        
+        def suggest(tag: str, confidence: float, reason: str, source: str):
+            current = seen_tags.get(tag)
+            if current is None or confidence > current.confidence:
+                seen_tags[tag] = TagSuggestion(
+                    tag=tag,
+                    confidence=confidence,
+                    reason=reason,
+                    source=source
+                )
         
         # 1. Component tag from path
         component = self._detect_component(file_path)
         if component:
-            suggestions.append(TagSuggestion(
-                tag=f"component:{component}",
-                confidence=1.0,
-                reason=f"File is in {component}/ directory",
-                source="path"
-            ))
+            suggest(self._COMPONENT_TAGS[component], 1.0,
+                    f"File is in {component}/ directory", "path")
         
         # 2. Type tag from content
         type_tag = self._detect_type(analysis)
-        suggestions.append(TagSuggestion(
-            tag=f"type:{type_tag}",
-            confidence=0.9,
-            reason=f"Detected {type_tag} from file structure",
-            source="structure"
-        ))
+        suggest(self._TYPE_TAGS[type_tag], 0.9,
+                f"Detected {type_tag} from file structure", "structure")
         
         # 3. Feature tags from imports
         feature_tags = self._detect_features_from_imports(analysis.imports_found)
         for tag, reason in feature_tags:
-            suggestions.append(TagSuggestion(
-                tag=f"feature:{tag}",
-                confidence=0.8,
-                reason=reason,
-                source="import"
-            ))
+            suggest(self._FEATURE_TAGS[tag], 0.8, reason, "import")
         
         # 4. Feature tags from class/function names
         name_features = self._detect_features_from_names(
             analysis.classes_found + analysis.functions_found
         )
         for tag, reason in name_features:
-            suggestions.append(TagSuggestion(
-                tag=f"feature:{tag}",
-                confidence=0.7,
-                reason=reason,
-                source="name"
-            ))
+            suggest(self._FEATURE_TAGS[tag], 0.7, reason, "name")
         
         # 5. Feature tags from docstring content
-        docstring_features = self._detect_features_from_content(content)
+        docstring_features = self._detect_features_from_content(docstring_area)
         for tag, reason in docstring_features:
-            suggestions.append(TagSuggestion(
-                tag=f"feature:{tag}",
-                confidence=0.6,
-                reason=reason,
-                source="content"
-            ))
-        
-        # Remove duplicates, keeping highest confidence
-        seen_tags = {}
-        for s in suggestions:
-            if s.tag not in seen_tags or s.confidence > seen_tags[s.tag].confidence:
-                seen_tags[s.tag] = s
+            suggest(self._FEATURE_TAGS[tag], 0.6, reason, "content")
         
         return list(seen_tags.values())
     
+    @staticmethod
+    def _path_dirs(file_path: Path) -> Set[str]:
+        """
+        Directory names that have a separator on both sides in the path
+        (what a '/name/' substring test matches): neither the first part
+        (root or leading directory) nor the file name.
+        """
+        return set(file_path.parts[1:-1])
+    
     def _detect_component(self, file_path: Path) -> Optional[str]:
         """Detect component from file path."""
-        path_str = str(file_path)
-        
-        if '/automation/' in path_str or '\\automation\\' in path_str:
-            return 'automation'
-        elif '/utils/' in path_str or '\\utils\\' in path_str:
-            return 'utils'
-        elif '/processing/' in path_str or '\\processing\\' in path_str:
-            return 'processing'
-        elif '/tests/' in path_str or '\\tests\\' in path_str:
-            return 'tests'
-        elif '/docs/' in path_str or '\\docs\\' in path_str:
-            return 'docs'
-        
-        return None
+        dirs = self._path_dirs(file_path)
+        return next((component for component in COMPONENTS if component in dirs), None)
     
     def _detect_type(self, analysis: FileTagAnalysis) -> str:
         """Detect primary type from file structure."""
@@ -320,81 +484,44 @@ class ASTAutoTagger:
         else:
             return 'script'
     
-    def _detect_features_from_imports(self, imports: List[str]) -> List[Tuple[str, str]]:
-        """Detect features from import statements."""
+    @staticmethod
+    def _first_features(strings: List[str],
+                        patterns: Tuple[Tuple[str, Tuple[str, str]], ...]) -> List[Tuple[str, str]]:
+        """(feature, reason) of the first pattern found in each string, if any."""
         features = []
         
-        # Map import patterns to features
-        import_map = {
-            'embed': ('embeddings', 'imports embedding-related module'),
-            'search': ('search', 'imports search-related module'),
-            'valid': ('validation', 'imports validation-related module'),
-            'logging': ('logging', 'imports logging module'),
-            'log': ('logging', 'imports logging-related module'),
-            'memory': ('memory', 'imports memory-related module'),
-            'llm': ('llm', 'imports LLM-related module'),
-            'openai': ('llm', 'imports OpenAI'),
-            'anthropic': ('llm', 'imports Anthropic'),
-            'vllm': ('llm', 'imports vLLM'),
-            'ast': ('validation', 'uses AST parsing'),
-            'yaml': ('config', 'uses YAML configuration'),
-            'json': ('config', 'uses JSON configuration'),
-        }
-        
-        for imp in imports:
-            imp_lower = imp.lower()
-            for pattern, (feature, reason) in import_map.items():
-                if pattern in imp_lower:
-                    features.append((feature, reason))
+        # Lowercase every string once, up front
+        for string_lower in [string.lower() for string in strings]:
+            for pattern, feature_reason in patterns:
+                if pattern in string_lower:
+                    features.append(feature_reason)
                     break
         
+        return features
+    
+    def _detect_features_from_imports(self, imports: List[str]) -> List[Tuple[str, str]]:
+        """Detect features from import statements."""
+        features = self._first_features(imports, self._IMPORT_PATTERNS)
         return list(set(features))
     
     def _detect_features_from_names(self, names: List[str]) -> List[Tuple[str, str]]:
         """Detect features from class/function names."""
-        features = []
-        
-        name_map = {
-            'validator': ('validation', 'Validator class/function found'),
-            'validate': ('validation', 'validate function found'),
-            'search': ('search', 'Search class/function found'),
-            'embed': ('embeddings', 'Embed class/function found'),
-            'tagger': ('tagging', 'Tagger class/function found'),
-            'tag': ('tagging', 'tag-related function found'),
-            'logger': ('logging', 'Logger class found'),
-            'memory': ('memory', 'Memory class found'),
-            'index': ('indexing', 'Index class/function found'),
-            'context': ('context', 'Context class/function found'),
-            'assembl': ('context', 'Assembler class/function found'),
-        }
-        
-        for name in names:
-            name_lower = name.lower()
-            for pattern, (feature, reason) in name_map.items():
-                if pattern in name_lower:
-                    features.append((feature, reason))
-                    break
-        
+        features = self._first_features(names, self._NAME_PATTERNS)
         return list(set(features))
     
-    def _detect_features_from_content(self, content: str) -> List[Tuple[str, str]]:
-        """Detect features from docstring content."""
-        features = []
-        content_lower = content.lower()
-        
-        # Only check docstring area (first 2000 chars)
-        docstring_area = content_lower[:2000]
+    def _detect_features_from_content(self, docstring_area: str) -> List[Tuple[str, str]]:
+        """
+        Detect features from docstring content.
         
-        content_map = {
-            'embedding': ('embeddings', 'mentions embedding in documentation'),
-            'semantic search': ('search', 'mentions semantic search'),
-            'validation': ('validation', 'mentions validation'),
-            'pipeline': ('pipeline', 'mentions pipeline processing'),
-            'analytics': ('analytics', 'mentions analytics'),
-            'llm': ('llm', 'mentions LLM integration'),
-        }
+        Args:
+            docstring_area: First DOCSTRING_AREA_CHARS chars of the file,
+                            lowercased (the caller slices before lowering)
+        """
+        features = []
         
-        for pattern, (feature, reason) in content_map.items():
+        # Six substring searches over at most 2000 chars, each in C: a
+        # compiled (e.g. Numba) multi-pattern scanner has nothing left to win
+        for pattern, (feature, reason) in self.CONTENT_FEATURES.items():
             if pattern in docstring_area:
                 features.append((feature, reason))
         
@@ -413,13 +540,13 @@ class ASTAutoTagger:
                     return tag
         
         # Generate based on path
-        path_str = str(file_path)
+        dirs = self._path_dirs(file_path)
         
-        if '/automation/' in path_str:
+        if 'automation' in dirs:
             return f"tool_{stem}"
-        elif '/specs/' in path_str:
+        elif 'specs' in dirs:
             return f"spec_{stem}"
-        elif '/utils/' in path_str:
+        elif 'utils' in dirs:
             return f"util_{stem}"
         else:
             return stem
@@ -444,18 +571,11 @@ class ASTAutoTagger:
         if not tags:
             return ""
         
-        # Format inline tags
-        inline_tags = ' '.join(f'<!--TAG:{s.tag}-->' for s in tags)
+        # Format inline tags (join() of a list: no generator to drive)
+        inline_tags = ' '.join([f'<!--TAG:{s.tag}-->' for s in tags])
         
         # Create block
-        block = f"""
-<!--TAG:{analysis.primary_tag}-->
-
-TAGS: {inline_tags}
-
-<!--/TAG:{analysis.primary_tag}-->
-"""
-        return block.strip()
+        return _TAG_BLOCK.format(primary=analysis.primary_tag, inline=inline_tags)
     # <!--/TAG:generate_tag_block:method-->
     
     def apply_tags(self, file_path: Path, analysis: FileTagAnalysis,
@@ -473,12 +593,6 @@ TAGS: {inline_tags}
         Returns:
             True if tags were applied successfully.
         """
-        try:
-            content = file_path.read_text(encoding='utf-8')
-        except Exception as e:
-            logger.error(f"Cannot read {file_path}: {e}")
-            return False
-        
         # Check if tags already exist
         if analysis.existing_tags:
             logger.info(f"{file_path} already has tags, skipping")
@@ -489,27 +603,31 @@ TAGS: {inline_tags}
         if not tag_block:
             return False
         
-        # Find insertion point (after shebang/encoding)
-        lines = content.split('\n')
-        insert_line = 0
-        
-        for i, line in enumerate(lines):
-            if line.startswith('#!') or 'coding' in line or line.strip() == '':
-                insert_line = i + 1
-            elif line.startswith('"""') or line.startswith("'''"):
-                # Insert before docstring
-                insert_line = i
-                break
-            else:
-                break
+        # Text as analyzed, if the analysis kept it
+        content = analysis.content
+        if content is None:
+            try:
+                content = file_path.read_text(encoding='utf-8')
+            except Exception as e:
+                logger.error(f"Cannot read {file_path}: {e}")
+                return False
+        
+        # Find insertion point: after the leading shebang/encoding/blank
+        # lines (before the docstring or first statement); only the header
+        # is scanned, the rest of the file is never split
+        offset = _HEADER_RE.match(content).end()
         
         # Insert tag block
-        lines.insert(insert_line, tag_block)
-        new_content = '\n'.join(lines)
+        if _HEADER_LINE_RE.fullmatch(content, offset):
+            # The whole file is header (its last, unterminated line too): append
+            new_content = content + '\n' + tag_block
+        else:
+            new_content = content[:offset] + tag_block + '\n' + content[offset:]
         
-        # Write back
+        # Write back (one binary write, no text layer)
         try:
-            file_path.write_text(new_content, encoding='utf-8')
+            with open(file_path, 'wb') as f:
+                f.write(new_content.encode('utf-8'))
             logger.info(f"Applied tags to {file_path}")
             return True
         except Exception as e:
@@ -556,6 +674,50 @@ TAGS: {inline_tags}
 
 # <!--/TAG:ASTAutoTagger:class-->
 
+# Per-process tagger of pool workers (see _init_worker)
+_worker_tagger: Optional[ASTAutoTagger] = None
+
+
+def _init_worker(schema_path: Path, cache_path: Optional[Path], keep_content: bool):
+    """Pool initializer: one tagger per worker process, reused for every file."""
+    global _worker_tagger
+    _worker_tagger = ASTAutoTagger(schema_path, cache_path, keep_content)
+
+
+def _analyze_one(path_str: str) -> FileTagAnalysis:
+    """Worker function: analyze one file with this process's tagger."""
+    return _worker_tagger.analyze_file(Path(path_str))
+
+
+def analyze_files(tagger: ASTAutoTagger, py_files: List[Path],
+                  max_workers: Optional[int] = None) -> List[FileTagAnalysis]:
+    """
+    Analyze many files, in parallel across a process pool.
+    
+    Analyses are independent and CPU-bound (ast.parse), so each worker
+    process runs its own tagger (same settings as tagger).
+    
+    Args:
+        tagger: Tagger to use in this process / to copy settings from
+        py_files: Files to analyze
+        max_workers: Number of worker processes (default: os.cpu_count(),
+                     1 = analyze serially in this process)
+    
+    Returns:
+        One FileTagAnalysis per file, in the order of py_files
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(py_files)) or 1
+    if workers == 1:
+        return [tagger.analyze_file(py_file) for py_file in py_files]
+    
+    # A few chunks per worker keeps the pool balanced without per-file IPC
+    chunksize = max(1, min(16, len(py_files) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(tagger.schema_path, tagger.cache_path,
+                                       tagger.keep_content)) as executor:
+        return list(executor.map(_analyze_one, map(str, py_files), chunksize=chunksize))
+
+
 def main():
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -570,36 +732,53 @@ def main():
                        help='Minimum confidence for applying tags (default: 0.7)')
     parser.add_argument('--report', action='store_true', help='Generate summary report')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignore and do not update the structure cache')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Worker processes for --directory/--all (default: CPU count)')
     
     args = parser.parse_args()
     
-    tagger = ASTAutoTagger()
-    analyses = []
+    cache_path = None if args.no_cache else Path(__file__).parent.parent / DEFAULT_CACHE_PATH
+    tagger = ASTAutoTagger(cache_path=cache_path, keep_content=args.apply)
     
     if args.file:
         # Single file
-        analysis = tagger.analyze_file(Path(args.file))
-        analyses.append(analysis)
+        py_files = [Path(args.file)]
         
     elif args.directory:
         # Directory
-        for py_file in Path(args.directory).rglob('*.py'):
-            if '__pycache__' not in str(py_file):
-                analyses.append(tagger.analyze_file(py_file))
+        py_files = [py_file for py_file in Path(args.directory).rglob('*.py')
+                    if '__pycache__' not in str(py_file)]
                 
     elif args.all:
         # Entire project
         project_root = Path(__file__).parent.parent
+        py_files = []
         for dir_name in ['docs/automation', 'utils', 'processing']:
             dir_path = project_root / dir_name
             if dir_path.exists():
-                for py_file in dir_path.rglob('*.py'):
-                    if '__pycache__' not in str(py_file):
-                        analyses.append(tagger.analyze_file(py_file))
+                py_files.extend(py_file for py_file in dir_path.rglob('*.py')
+                                if '__pycache__' not in str(py_file))
     else:
         parser.print_help()
         return
     
+    # apply_tags skips files that already have tags: when applying, don't
+    # analyze the ones whose header already shows a tag
+    skipped = 0
+    if args.apply and not args.json:
+        untagged = []
+        for py_file in py_files:
+            if tagger.has_existing_tags(py_file):
+                logger.info(f"{py_file} already has tags, skipping")
+            else:
+                untagged.append(py_file)
+        skipped = len(py_files) - len(untagged)
+        py_files = untagged
+    
+    analyses = analyze_files(tagger, py_files, args.workers)
+    
     # Output
     if args.json:
         import json
@@ -623,7 +802,7 @@ def main():
         for analysis in analyses:
             if tagger.apply_tags(Path(analysis.file_path), analysis, args.min_confidence):
                 applied_count += 1
-        print(f"\nApplied tags to {applied_count}/{len(analyses)} files")
+        print(f"\nApplied tags to {applied_count}/{len(analyses) + skipped} files")
         
     elif args.report:
         # Summary report
@@ -4,7 +4,8 @@
         let mediaRecorder = null;
         let audioChunks = [];
         let isRecording = false;
-        let timerInterval = null;
+        let timerFrame = null;
+        let lastTimerSecond = -1;
         let startTime = null;
         
         // Text storage
@@ -61,7 +62,9 @@
                 recordStatus.textContent = 'Recording... Click to stop';
                 
                 startTime = Date.now();
-                timerInterval = setInterval(updateTimer, 100);
+                lastTimerSecond = -1;
+                cancelAnimationFrame(timerFrame);
+                timerFrame = requestAnimationFrame(updateTimer);
             } catch (err) {
                 recordStatus.textContent = 'Error: ' + err.message;
             }
@@ -74,16 +77,23 @@
                 isRecording = false;
                 recordBtn.classList.remove('recording');
                 recordBtn.textContent = '🎙️';
-                clearInterval(timerInterval);
+                cancelAnimationFrame(timerFrame);
             }
         }
         
+        // Runs once per frame while recording (paused by the browser in
+        // hidden tabs); the DOM is only written when the second changes
         function updateTimer() {
+            if (!isRecording) return;
             const elapsed = Date.now() - startTime;
             const seconds = Math.floor(elapsed / 1000);
-            const minutes = Math.floor(seconds / 60);
-            const secs = seconds % 60;
-            recordTimer.textContent = String(minutes).padStart(2, '0') + ':' + String(secs).padStart(2, '0');
+            if (seconds !== lastTimerSecond) {
+                lastTimerSecond = seconds;
+                const minutes = Math.floor(seconds / 60);
+                const secs = seconds % 60;
+                recordTimer.textContent = String(minutes).padStart(2, '0') + ':' + String(secs).padStart(2, '0');
+            }
+            timerFrame = requestAnimationFrame(updateTimer);
         }
         
         recordBtn.addEventListener('click', () => {
@@ -806,7 +816,7 @@
                               !searchScope.excludedDirs.some(d => node.path.startsWith(d));
             
             let html = `
-            <div class="tree-node depth-${depth}" data-path="${escapeHtml(node.path)}" data-type="${node.type}">
+            <div class="tree-node" style="--depth:${depth}" data-path="${escapeHtml(node.path)}" data-type="${node.type}">
                 ${isDir ? `<span class="tree-toggle" onclick="toggleDirExpand('${escapeHtml(node.path)}')">${isExpanded ? '▼' : '▶'}</span>` : '<span class="tree-toggle"></span>'}
                 <input type="checkbox" class="tree-checkbox" ${isIncluded ? 'checked' : ''} 
                        onchange="toggleTreeInclude('${escapeHtml(node.path)}', '${node.type}', this.checked)">
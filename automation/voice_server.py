@@ -27,9 +27,25 @@ DEPENDENCIES (Quick Reference):
         - docs.utils.docs_logger (DocsLogger)
     External:
         - Flask (pip install flask)
+        - brotli (optional, pip install brotli) - Brotli-compressed index page
         - faster-whisper (pip install faster-whisper) — replaces whisper.cpp
         - vLLM server (localhost:8000)
 
+DEPLOYMENT:
+    Services are built on first use. For several workers, run
+        WHISPER_PRELOAD=1 gunicorn --preload -w N automation.voice_server:app
+        which builds them once in the master before forking, so workers
+        share them copy-on-write instead of each importing and loading.
+        With WHISPER_DEVICE=cpu the same flag makes an in-process model
+        load its weights pre-fork (and WHISPER_WARMUP=1 warm it there).
+        Otherwise the device is only probed, and the model loaded and
+        warmed, in each worker, because CUDA cannot be forked.
+    WHISPER_BATCHED=1: coalesce concurrent /transcribe requests into one
+        batched decode (TranscriptionBatcher, in-process model). Batched
+        clips bypass Silero VAD, so batching only applies with
+        WHISPER_VAD=0; long or VAD-filtered uploads are transcribed on
+        their own request thread as without the flag.
+
 RECENT CHANGES:
     2025-12-16: MIGRATED from whisper.cpp to faster-whisper (82.7x real-time)
     2025-12-12: Created voice server with premium UI
@@ -44,6 +60,10 @@ import tempfile  # Temporary file handling
 from pathlib import Path  # Filesystem paths
 from datetime import datetime  # Timestamps
 import sys  # System path manipulation
+import threading  # Lazy service construction lock
+import gzip  # Pre-compressed index page
+import re  # Index page minification
+import hashlib  # Content hashes for static asset URLs
 
 # Add docs to Python path for isolated utilities
 DOCS_DIR = Path(__file__).resolve().parent.parent  # docs/ directory (actually nss_coder root)
@@ -52,11 +72,19 @@ sys.path.insert(0, str(DOCS_DIR))  # Project root (nss_coder)
 
 # Flask import with error handling
 try:
-    from flask import render_template, Flask, request, jsonify, send_from_directory, Response
+    from flask import render_template, Flask, Request, request, jsonify, send_from_directory, Response, stream_with_context, url_for
+    from markupsafe import Markup  # Installed with Flask
 except ImportError:
     print("Flask not installed. Install with: pip install flask")
     sys.exit(1)
 
+# Brotli is optional: ~20% smaller index page than gzip when available
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
 # Import our voice modules
 # Import our voice modules
 try:
@@ -73,14 +101,13 @@ except ImportError:
 # Performance improvement: 12-28x -> 82.7x real-time on RTX PRO 6000 Blackwell
 # Old import: from automation.voice_whisper import VoiceWhisper, TranscriptionResult
 # ============================================================================
-# ============================================================================
-from automation.voice_whisper_client import (
-    get_faster_whisper_service
-)
-from automation.voice_processor import VoiceProcessor, ProcessingResult  # Processing
+# Voice modules (automation.voice_whisper_client, automation.voice_processor)
+# are imported by the service factories below, on first use.
 
-# Initialize logger
+# Initialize logger; records are written by a background thread so request
+# handlers never wait on log file I/O
 logger = DocsLogger("voice_server")
+logger.use_background_thread()
 
 
 # ============================================================================
@@ -89,15 +116,138 @@ logger = DocsLogger("voice_server")
 
 app = Flask(__name__, static_folder='static')
 app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024  # 100MB max upload
+app.config['MAX_FORM_MEMORY_SIZE'] = 1024 * 1024  # Non-file form fields only
+
+
+class _LazyService:
+    """
+    Proxy that builds a service on first attribute access.
+    
+    Importing the voice modules pulls in torch/CTranslate2/CUDA and the LLM
+    client; routes that never touch a service (/, static files) should not
+    pay for that on every reload or worker start.
+    """
+    
+    def __init__(self, factory):
+        self._factory = factory
+        self._instance = None
+        self._lock = threading.Lock()
+    
+    def load(self):
+        """Build the service now (idempotent, thread-safe) and return it."""
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory()
+        return self._instance
+    
+    def __getattr__(self, name):
+        # Only called for names not set in __init__, i.e. service attributes
+        return getattr(self.load(), name)
+
+
+def _create_whisper():
+    """Whisper service singleton (MIGRATION: faster-whisper, 82.7x speedup)."""
+    from automation.voice_whisper_client import get_faster_whisper_service
+    return get_faster_whisper_service()
+
+
+def _create_processor():
+    """Text enhancement / search processor."""
+    from automation.voice_processor import VoiceProcessor
+    return VoiceProcessor()
+
+
+def _create_local_whisper():
+    """In-process FasterWhisperService (segment streaming needs the model here)."""
+    from automation.voice_whisper_fast import get_faster_whisper_service
+    return get_faster_whisper_service()
+
+
+# Initialize services (built on first use)
+whisper = _LazyService(_create_whisper)
+local_whisper = _LazyService(_create_local_whisper)
+processor = _LazyService(_create_processor)
+
+# WHISPER_PRELOAD=1: build them at import so `gunicorn --preload` shares
+# them across workers (see DEPLOYMENT)
+if os.environ.get("WHISPER_PRELOAD") == "1":
+    whisper.load()
+    processor.load()
+
+# Optional cross-request batching with an in-process model (WHISPER_BATCHED=1):
+# concurrent short uploads share one encoder pass
+batcher = None
+if os.environ.get("WHISPER_BATCHED") == "1":
+    from automation.voice_whisper_fast import get_transcription_batcher
+    batcher = get_transcription_batcher()
+
+
+def _pick_recordings_dir() -> Path:
+    """
+    Choose where uploaded audio is written before transcription.
+    
+    Prefers RAM-backed storage (/dev/shm, then the system temp dir) so an
+    upload never waits on a disk write; falls back to automation/recordings.
+    """
+    candidates = []
+    if os.path.isdir("/dev/shm"):
+        candidates.append(Path("/dev/shm") / "nss_coder_recordings")
+    candidates.append(Path(tempfile.gettempdir()) / "nss_coder_recordings")
+    
+    for candidate in candidates:
+        try:
+            candidate.mkdir(exist_ok=True)
+            if os.access(candidate, os.W_OK):
+                return candidate
+        except OSError:
+            continue
+    
+    fallback = AUTOMATION_DIR / "recordings"
+    fallback.mkdir(exist_ok=True)
+    return fallback
 
-# Initialize services
-# MIGRATION: Using FasterWhisperService instead of VoiceWhisper for 82.7x speedup
-whisper = get_faster_whisper_service()  # Singleton instance with GPU acceleration
-processor = VoiceProcessor()
 
 # Recordings directory for temporary audio files
-RECORDINGS_DIR = AUTOMATION_DIR / "recordings"
-RECORDINGS_DIR.mkdir(exist_ok=True)
+RECORDINGS_DIR = _pick_recordings_dir()
+
+
+class RecordingRequest(Request):
+    """
+    Request that streams uploaded file parts straight into RECORDINGS_DIR.
+    
+    Werkzeug's default spools each upload into a SpooledTemporaryFile
+    (memory, then an anonymous temp file) that the route would copy again
+    with save(); writing into RECORDINGS_DIR lets /transcribe hand the
+    file's path to whisper as-is. The file is removed when the request
+    closes its uploads.
+    """
+    
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return tempfile.NamedTemporaryFile(dir=RECORDINGS_DIR, prefix="upload_", suffix=".webm")
+
+
+app.request_class = RecordingRequest
+
+
+def _upload_path(audio_file):
+    """
+    Locate an uploaded audio part on disk.
+    
+    Returns:
+        (path, owns_file): owns_file is True when the caller must save()
+        the part to path and delete it afterwards
+    """
+    # The upload was streamed into RECORDINGS_DIR by RecordingRequest;
+    # only copy it when the part arrived some other way
+    upload_name = getattr(audio_file.stream, 'name', None)
+    if isinstance(upload_name, str) and Path(upload_name).parent == RECORDINGS_DIR:
+        audio_file.stream.flush()
+        return Path(upload_name), False  # Deleted with the request's uploads
+    
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Random suffix: concurrent uploads in the same second must not share (and delete) a file
+    return RECORDINGS_DIR / f"recording_{timestamp}_{os.urandom(4).hex()}.webm", True
 
 
 # ============================================================================
@@ -108,6 +258,100 @@ RECORDINGS_DIR.mkdir(exist_ok=True)
 
 # INDEX_HTML moved to templates/index.html
 
+# Content hash per static file, keyed by (filename, mtime_ns)
+_STATIC_HASHES = {}
+
+# Year-long, never-revalidated caching for content-hashed asset URLs
+STATIC_IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+
+def versioned_static(filename: str) -> str:
+    """
+    URL of a static file with its content hash appended (?v=<hash>).
+    
+    A changed file gets a new URL, so responses to versioned URLs can be
+    cached as immutable (see _cache_versioned_static) and repeat visits
+    skip the download entirely.
+    """
+    path = Path(app.static_folder) / filename
+    key = (filename, path.stat().st_mtime_ns)
+    digest = _STATIC_HASHES.get(key)
+    if digest is None:
+        digest = hashlib.md5(path.read_bytes()).hexdigest()[:8]
+        _STATIC_HASHES[key] = digest
+    return url_for('static', filename=filename, v=digest)
+
+
+app.add_template_global(versioned_static)
+
+# Static file text for inlining, keyed by (filename, mtime_ns)
+_STATIC_TEXT = {}
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+
+
+def inline_static(filename: str) -> Markup:
+    """Contents of a static CSS file for inlining into a template, comments dropped."""
+    path = Path(app.static_folder) / filename
+    key = (filename, path.stat().st_mtime_ns)
+    text = _STATIC_TEXT.get(key)
+    if text is None:
+        text = Markup(_CSS_COMMENT_RE.sub('', path.read_text(encoding='utf-8')).strip())
+        _STATIC_TEXT[key] = text
+    return text
+
+
+app.add_template_global(inline_static)
+
+
+@app.after_request
+def _cache_versioned_static(response):
+    """Mark content-hashed static responses as cacheable forever."""
+    if request.endpoint == 'static' and request.args.get('v') and response.status_code == 200:
+        response.cache_control.no_cache = None  # Flask's default for static files
+        response.cache_control.public = True
+        response.cache_control.max_age = STATIC_IMMUTABLE_MAX_AGE
+        response.cache_control.immutable = True
+    return response
+
+
+# Rendered, minified index page per script root: {encoding: body}. Compressed once
+# (gzip 9, Brotli 11), so requests only pick a buffer.
+_INDEX_BODIES = {}
+
+# Whitespace-sensitive elements are kept verbatim by _minify_html()
+_HTML_VERBATIM_RE = re.compile(r'(<(pre|textarea)\b.*?</\2>)', re.IGNORECASE | re.DOTALL)
+_HTML_COMMENT_RE = re.compile(r'<!--(?!\[).*?-->', re.DOTALL)  # Keeps <!--[if ...]>
+_HTML_LINE_SPACE_RE = re.compile(r'[ \t]*\n\s*')
+
+
+def _minify_html(html: str) -> str:
+    """
+    Drop comments and indentation from the rendered page.
+    
+    Each run of line breaks plus indentation becomes a single newline,
+    which HTML treats exactly like the whitespace it replaces, so layout
+    and inline text spacing are unchanged.
+    """
+    parts = _HTML_VERBATIM_RE.split(html)
+    # split() yields [text, block, tag name, text, block, tag name, ...]
+    for i in range(0, len(parts), 3):
+        text = _HTML_COMMENT_RE.sub('', parts[i])
+        parts[i] = _HTML_LINE_SPACE_RE.sub('\n', text)
+    del parts[2::3]
+    return ''.join(parts).strip()
+
+
+def _index_bodies() -> dict:
+    """Render and pre-compress templates/index.html (cached unless debugging)."""
+    root = request.script_root  # url_for() output depends on it
+    bodies = _INDEX_BODIES.get(root)
+    if bodies is None or app.debug:
+        html = _minify_html(render_template('index.html')).encode('utf-8')
+        bodies = {'identity': html, 'gzip': gzip.compress(html, 9)}
+        if HAS_BROTLI:
+            bodies['br'] = brotli.compress(html, quality=11)
+        _INDEX_BODIES[root] = bodies
+    return bodies
 
 
 # ============================================================================
@@ -116,8 +360,20 @@ RECORDINGS_DIR.mkdir(exist_ok=True)
 
 @app.route('/')
 def index():
-    """Serve the main HTML page."""
-    return render_template('index.html')
+    """Serve the main HTML page (pre-compressed when the client accepts it)."""
+    bodies = _index_bodies()
+    
+    encoding = 'identity'
+    for candidate in ('br', 'gzip'):
+        if candidate in bodies and request.accept_encodings[candidate]:
+            encoding = candidate
+            break
+    
+    response = Response(bodies[encoding], mimetype='text/html')
+    if encoding != 'identity':
+        response.headers['Content-Encoding'] = encoding
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
 
 
 @app.route('/health')
@@ -155,18 +411,21 @@ def transcribe():
     if audio_file.filename == '':
         return jsonify({"success": False, "error": "Empty filename"}), 400
     
-    # Save to temporary file
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    temp_path = RECORDINGS_DIR / f"recording_{timestamp}.webm"
+    temp_path, owns_file = _upload_path(audio_file)
     
     try:
-        audio_file.save(str(temp_path))
+        if owns_file:
+            audio_file.save(str(temp_path))
         logger.info(f"Saved audio to {temp_path}", {
             "size_kb": temp_path.stat().st_size / 1024
         })
         
-        # Transcribe
-        result = whisper.transcribe(temp_path)
+        # Transcribe (requests the batcher hands back run on this thread)
+        future = batcher.submit(temp_path) if batcher is not None else None
+        if future is not None:
+            result = future.result()
+        else:
+            result = whisper.transcribe(temp_path)
         
         if result.success:
             return jsonify({
@@ -186,9 +445,71 @@ def transcribe():
         logger.error(f"Transcription error: {e}")
         return jsonify({"success": False, "error": str(e)}), 500
     finally:
-        # Clean up temp file after a delay (in case needed for debugging)
-        # In production, clean immediately
-        pass
+        # RECORDINGS_DIR is usually RAM-backed, so never leave uploads behind
+        if owns_file:
+            temp_path.unlink(missing_ok=True)
+
+
+def _sse(data: dict, event: str = None) -> str:
+    """Format one Server-Sent Event."""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@app.route('/transcribe_stream', methods=['POST'])
+def transcribe_stream():
+    """
+    Transcribe uploaded audio, streaming segments as they are decoded.
+    
+    Expects: multipart form with 'audio' file
+    Returns: text/event-stream - one `data:` JSON per segment
+             ({text, start, end}), then `event: done` with the full text
+             or `event: error`
+    """
+    logger.info("Received streaming transcription request")
+    
+    if 'audio' not in request.files:
+        return jsonify({"success": False, "error": "No audio file provided"}), 400
+    
+    audio_file = request.files['audio']
+    
+    if audio_file.filename == '':
+        return jsonify({"success": False, "error": "Empty filename"}), 400
+    
+    # The request closes (and deletes) its uploads when this view returns,
+    # before the stream is consumed, so the generator needs its own file:
+    # a hard link of the streamed upload (no copy) or a saved copy
+    temp_path, owns_file = _upload_path(audio_file)
+    try:
+        if owns_file:
+            audio_file.save(str(temp_path))
+        else:
+            upload_path = temp_path
+            temp_path = upload_path.with_name(f"stream_{upload_path.name}")
+            os.link(upload_path, temp_path)
+    except OSError as e:
+        logger.error(f"Could not stage upload: {e}")
+        return jsonify({"success": False, "error": str(e)}), 500
+    
+    def generate():
+        texts = []
+        try:
+            for segment in local_whisper.transcribe_stream(temp_path):
+                texts.append(segment.text)
+                yield _sse({"text": segment.text, "start": segment.start, "end": segment.end})
+            
+            yield _sse({"success": True, "text": "".join(texts).strip()}, event="done")
+        except Exception as e:
+            logger.error(f"Streaming transcription error: {e}")
+            yield _sse({"success": False, "error": str(e)}, event="error")
+        finally:
+            temp_path.unlink(missing_ok=True)
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
 
 @app.route('/process', methods=['POST'])
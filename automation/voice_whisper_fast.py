@@ -19,7 +19,22 @@ TAGS: <!--TAG:component:automation--> <!--TAG:type:script--> <!--TAG:feature:tra
 DEPENDENCIES:
     Python:
         - faster-whisper>=1.2.0 (CTranslate2 backend)
-        - torch (for GPU detection)
+        - torch (optional, GPU details for health checks)
+    Environment:
+        - WHISPER_DEVICE: "cuda" or "cpu" (default: cuda if available,
+          probed on first model load, never at import)
+        - WHISPER_COMPUTE_TYPE: precision (default: int8_bfloat16 on
+          Ampere+, int8_float16 on older GPUs, int8 on CPU; picked and
+          logged on first model load)
+        - WHISPER_VAD: "0" disables Silero VAD silence stripping (default: on)
+        - WHISPER_WARMUP: "1" warms the model up: with the singleton for
+          WHISPER_DEVICE=cpu, otherwise on first load in each process
+        - WHISPER_PRELOAD: "1" with WHISPER_DEVICE=cpu loads the weights
+          with the singleton, so workers forked by `gunicorn --preload`
+          share them copy-on-write
+        - WHISPER_CPU_THREADS: threads per model (default: min(4, cores)),
+          also the OMP_NUM_THREADS default. Keep server workers x
+          WHISPER_CPU_THREADS <= physical cores.
     Hardware:
         - NVIDIA GPU with CUDA support (primary)
         - CPU fallback available
@@ -39,10 +54,15 @@ import os  # Operating system interface
 import time  # Time measurement for performance logging
 import tempfile  # Temporary file management
 import subprocess  # For ffmpeg audio conversion
+import wave  # Header check for the raw PCM fast path
 from pathlib import Path  # Object-oriented filesystem paths
 from typing import Optional, Dict, Any, List, Generator, Union  # Type hints
 from dataclasses import dataclass, field  # Structured data classes
 import sys  # System-specific parameters
+import queue  # Request queue for the batching worker
+import threading  # Background batching worker
+from bisect import bisect_right  # Map batched segments back to requests
+from concurrent.futures import Future  # Per-request batched results
 
 # ============================================================================
 # CUDA LIBRARY PATH SETUP (Must be done before importing faster-whisper)
@@ -76,6 +96,11 @@ def _setup_cuda_library_paths():
 # Apply CUDA library path setup
 _setup_cuda_library_paths()
 
+# CTranslate2 sizes its OpenMP pool when the library loads; default it to
+# the per-model thread cap so concurrent requests do not oversubscribe cores
+DEFAULT_CPU_THREADS = int(os.environ.get("WHISPER_CPU_THREADS", min(4, os.cpu_count() or 1)))
+os.environ.setdefault("OMP_NUM_THREADS", str(DEFAULT_CPU_THREADS))
+
 # Add docs to Python path for isolated utilities
 DOCS_DIR = Path(__file__).resolve().parent.parent  # Navigate to docs/ directory
 # Add project root to Python path for portable imports
@@ -93,7 +118,8 @@ except ImportError:
 
 # Check faster-whisper availability
 try:
-    from faster_whisper import WhisperModel, BatchedInferencePipeline
+    from faster_whisper import WhisperModel, BatchedInferencePipeline, decode_audio
+    import numpy as np  # Installed with faster-whisper
     FASTER_WHISPER_AVAILABLE = True
 except ImportError:
     FASTER_WHISPER_AVAILABLE = False
@@ -104,20 +130,76 @@ except ImportError:
 # CONFIGURATION
 # ============================================================================
 
+def _cuda_available() -> bool:
+    """
+    Check for a CUDA device via CTranslate2 (already loaded by faster-whisper).
+    
+    This initializes CUDA in the calling process, so it only runs from
+    _ensure_model_loaded(): never at import, where it would poison the
+    pre-fork master of `gunicorn --preload`.
+    """
+    try:
+        import ctranslate2
+        return ctranslate2.get_cuda_device_count() > 0
+    except Exception:
+        return False
+
+
 # Model configuration
 DEFAULT_MODEL_SIZE = "large-v3"  # Best quality for Russian and English
-DEFAULT_DEVICE = "cuda"  # GPU acceleration
-DEFAULT_COMPUTE_TYPE = "float16"  # FP16 for speed/memory balance
+# "auto" is resolved on first model load, in the process that runs the model
+DEFAULT_DEVICE = os.environ.get("WHISPER_DEVICE") or "auto"
+
+
+def _pick_compute_type(device: str) -> str:
+    """
+    Choose the INT8 weight precision for a device.
+    
+    INT8 weights halve the bytes moved per matmul vs FP16. On GPU the
+    activations use bfloat16 where supported (Ampere+, compute capability
+    >= 8.0): same exponent range as fp32, so long decodes cannot overflow.
+    Older GPUs fall back to float16 activations, CPU to plain int8.
+    Queries CUDA, so it is only called when the model is loaded.
+    """
+    if device != "cuda":
+        return "int8"
+    try:
+        import ctranslate2
+        # CTranslate2 only lists bfloat16 types for devices that run them natively
+        if "int8_bfloat16" in ctranslate2.get_supported_compute_types("cuda"):
+            return "int8_bfloat16"
+    except Exception:
+        pass
+    return "int8_float16"
+
+
+# Override with WHISPER_COMPUTE_TYPE (e.g. "float16"); "auto" is picked per
+# device by _pick_compute_type() on first model load
+DEFAULT_COMPUTE_TYPE = os.environ.get("WHISPER_COMPUTE_TYPE") or "auto"
 DEFAULT_BATCH_SIZE = 32  # Optimal for 96GB VRAM (can go up to 64)
+SAMPLE_RATE = 16000  # Whisper input rate (mono float32)
 
 # VAD (Voice Activity Detection) configuration
-DEFAULT_VAD_FILTER = True  # Remove silence for efficiency
+DEFAULT_VAD_FILTER = os.environ.get("WHISPER_VAD", "1") != "0"  # Remove silence for efficiency
 DEFAULT_VAD_PARAMETERS = {
     "min_silence_duration_ms": 500,  # Minimum silence to split on
     "speech_pad_ms": 400,  # Padding around speech segments
     "threshold": 0.5  # VAD confidence threshold
 }
 
+# Load CPU weights when the singleton is created, so a pre-fork server
+# (gunicorn --preload) shares them copy-on-write across workers (opt-in)
+WHISPER_PRELOAD = os.environ.get("WHISPER_PRELOAD", "0") == "1"
+
+# Cross-request batching (TranscriptionBatcher)
+BATCH_WINDOW_SEC = 0.03  # How long the first request waits for company
+BATCH_MAX_REQUESTS = 8  # Requests coalesced into one encoder batch
+BATCH_MAX_AUDIO_SEC = 240.0  # Caps activations per batch (VRAM)
+BATCH_MAX_CLIP_SEC = 30.0  # Longer clips span several windows; run alone
+
+# Decode a short silent clip once the model is loaded (opt-in)
+WHISPER_WARMUP = os.environ.get("WHISPER_WARMUP", "0") == "1"
+
 
 # ============================================================================
 # DATA STRUCTURES
@@ -159,6 +241,35 @@ class TranscriptionResult:
         return 0.0
 
 
+# ============================================================================
+# AUDIO LOADING
+# ============================================================================
+
+def _read_pcm16_mono_wav(audio_path: Path) -> Optional["np.ndarray"]:
+    """
+    Load a WAV file that is already in Whisper's input format.
+    
+    16 kHz mono 16-bit PCM only needs a scale to float32, so such files
+    skip the PyAV decode/resample (and the ffprobe call) entirely.
+    
+    Returns:
+        float32 samples in [-1, 1), or None for any other format
+    """
+    try:
+        with wave.open(str(audio_path), "rb") as wav:
+            if (wav.getframerate() != SAMPLE_RATE or wav.getnchannels() != 1
+                    or wav.getsampwidth() != 2):
+                return None
+            frames = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError, OSError):
+        return None  # Not RIFF/WAVE PCM (webm, mp3, ...)
+    
+    # One float32 allocation, scaled in place (no second temporary array)
+    samples = np.frombuffer(frames, dtype="<i2").astype(np.float32)
+    samples *= 1.0 / 32768.0
+    return samples
+
+
 # ============================================================================
 # FASTER WHISPER SERVICE
 # ============================================================================
@@ -185,17 +296,21 @@ class FasterWhisperService:
         device: str = DEFAULT_DEVICE,
         compute_type: str = DEFAULT_COMPUTE_TYPE,
         batch_size: int = DEFAULT_BATCH_SIZE,
-        cpu_threads: int = 0  # 0 = auto-detect
+        cpu_threads: int = DEFAULT_CPU_THREADS,  # 0 = CTranslate2 default (all cores)
+        num_workers: int = 1,
+        use_vad: bool = DEFAULT_VAD_FILTER
     ):
         """
         Initialize FasterWhisperService.
         
         Args:
             model_size: Whisper model size ("large-v3", "medium", etc.)
-            device: Device to use ("cuda" or "cpu")
-            compute_type: Compute precision ("float16", "int8", etc.)
+            device: Device to use ("cuda", "cpu" or "auto" = resolved on load)
+            compute_type: Compute precision ("int8_bfloat16", "int8", "float16", etc.)
             batch_size: Batch size for batched inference
             cpu_threads: Number of CPU threads (0 = auto)
+            num_workers: Parallel model replicas for concurrent transcribe() calls
+            use_vad: Default for transcribe(): strip silence with Silero VAD
         """
         if not FASTER_WHISPER_AVAILABLE:
             raise RuntimeError("faster-whisper not installed")
@@ -205,10 +320,13 @@ class FasterWhisperService:
         self.compute_type = compute_type
         self.batch_size = batch_size
         self.cpu_threads = cpu_threads
+        self.num_workers = num_workers
+        self.use_vad = use_vad
         
         # Model instances (lazy loaded)
         self._model: Optional[WhisperModel] = None
         self._batched_pipeline: Optional[BatchedInferencePipeline] = None
+        self._warmup_on_load = False  # Set for deferred WHISPER_WARMUP
         
         logger.info("FasterWhisperService initialized", {
             "model_size": model_size,
@@ -217,9 +335,20 @@ class FasterWhisperService:
             "batch_size": batch_size
         })
     
+    def _resolve_device(self) -> None:
+        """Replace "auto" device/precision with concrete values (probes CUDA)."""
+        if self.device == "auto":
+            self.device = "cuda" if _cuda_available() else "cpu"
+        if self.compute_type == "auto":
+            self.compute_type = _pick_compute_type(self.device)
+        # Logged per loading process so a worker never silently runs at an
+        # unexpected precision
+        logger.info(f"Whisper precision: {self.compute_type} on {self.device}")
+    
     def _ensure_model_loaded(self) -> WhisperModel:
         """Lazy load the Whisper model."""
         if self._model is None:
+            self._resolve_device()
             logger.info(f"Loading Whisper model: {self.model_size}")
             start = time.time()
             
@@ -227,11 +356,19 @@ class FasterWhisperService:
                 self.model_size,
                 device=self.device,
                 compute_type=self.compute_type,
-                cpu_threads=self.cpu_threads if self.device == "cpu" else 0
+                cpu_threads=self.cpu_threads if self.device == "cpu" else 0,
+                num_workers=self.num_workers
             )
             
             load_time = time.time() - start
             logger.info(f"Model loaded in {load_time:.2f}s")
+            
+            if self._warmup_on_load:
+                self._warmup_on_load = False
+                try:
+                    self._decode_silence(self._model)
+                except Exception as e:
+                    logger.warning(f"Whisper warm-up failed: {e}")
         
         return self._model
     
@@ -244,6 +381,43 @@ class FasterWhisperService:
         
         return self._batched_pipeline
     
+    def warmup(self) -> float:
+        """
+        Load the model and decode 0.5 s of silence, discarding the result.
+        
+        CTranslate2 defers weight paging, CUDA context setup and kernel
+        selection to the first decode; doing it here keeps that stall off
+        the first real request.
+        
+        This is also the only launch-overhead lever available: CTranslate2
+        runs the encoder internally and exposes no device tensors, so its
+        fixed (80, 3000) short-clip forward cannot be captured as a CUDA
+        Graph from Python.
+        
+        Returns:
+            Warm-up time in seconds
+        """
+        start = time.time()
+        self._decode_silence(self._ensure_model_loaded())
+        
+        warmup_time = time.time() - start
+        logger.info(f"Model warmed up in {warmup_time:.2f}s")
+        return warmup_time
+    
+    @staticmethod
+    def _decode_silence(model: WhisperModel) -> None:
+        """Run one full decode of 0.5 s of silence (see warmup)."""
+        import numpy as np  # faster-whisper dependency
+        
+        segments_gen, _ = model.transcribe(
+            np.zeros(8000, dtype=np.float32),  # 0.5 s at 16 kHz
+            language="en",
+            vad_filter=False
+        )
+        # Segments are generated lazily; drain them to run the decoder
+        for _ in segments_gen:
+            pass
+    
     def _get_audio_duration(self, audio_path: Path) -> float:
         """Get audio duration in seconds using ffprobe."""
         try:
@@ -262,7 +436,7 @@ class FasterWhisperService:
         self,
         audio_path: Union[str, Path],
         language: str = "ru",
-        use_vad: bool = DEFAULT_VAD_FILTER,
+        use_vad: Optional[bool] = None,
         vad_parameters: Optional[Dict] = None,
         use_batched: bool = True,
         word_timestamps: bool = False
@@ -274,6 +448,7 @@ class FasterWhisperService:
             audio_path: Path to audio file (any format supported by ffmpeg)
             language: Language code ("ru", "en", or None for auto-detect)
             use_vad: Enable Voice Activity Detection filtering
+                (None = service default, see __init__)
             vad_parameters: Custom VAD parameters (optional)
             use_batched: Use batched inference pipeline (recommended)
             word_timestamps: Enable word-level timestamps
@@ -283,6 +458,9 @@ class FasterWhisperService:
         """
         audio_path = Path(audio_path)
         
+        if use_vad is None:
+            use_vad = self.use_vad
+        
         if not audio_path.exists():
             return TranscriptionResult(error=f"Audio file not found: {audio_path}")
         
@@ -292,8 +470,16 @@ class FasterWhisperService:
             "use_batched": use_batched
         })
         
-        # Get audio duration for stats
-        audio_duration = self._get_audio_duration(audio_path)
+        # Raw 16 kHz mono PCM goes to the model as an array; anything else
+        # is decoded by PyAV from the path
+        samples = _read_pcm16_mono_wav(audio_path)
+        if samples is not None:
+            audio_input = samples
+            audio_duration = samples.shape[0] / SAMPLE_RATE
+        else:
+            audio_input = str(audio_path)
+            # Get audio duration for stats
+            audio_duration = self._get_audio_duration(audio_path)
         
         start_time = time.time()
         
@@ -305,7 +491,7 @@ class FasterWhisperService:
                 # Use batched pipeline for better performance
                 pipeline = self._ensure_batched_pipeline()
                 segments_gen, info = pipeline.transcribe(
-                    str(audio_path),
+                    audio_input,
                     batch_size=self.batch_size,
                     language=language,
                     vad_filter=use_vad,
@@ -316,7 +502,7 @@ class FasterWhisperService:
                 # Use regular model
                 model = self._ensure_model_loaded()
                 segments_gen, info = model.transcribe(
-                    str(audio_path),
+                    audio_input,
                     language=language,
                     vad_filter=use_vad,
                     vad_parameters=vad_params if use_vad else None,
@@ -372,11 +558,49 @@ class FasterWhisperService:
                 duration_process_sec=process_time
             )
     
+    def transcribe_stream(
+        self,
+        audio_path: Union[str, Path],
+        language: str = "ru",
+        use_vad: Optional[bool] = None
+    ) -> Generator[TranscriptionSegment, None, None]:
+        """
+        Yield segments as they are decoded.
+        
+        Uses the sequential model rather than the batched pipeline: the
+        pipeline decodes a whole batch of windows before yielding anything,
+        while WhisperModel yields each segment as soon as its window is done.
+        
+        Args:
+            audio_path: Path to audio file
+            language: Language code ("ru", "en", or None for auto-detect)
+            use_vad: Enable VAD filtering (None = service default)
+        
+        Yields:
+            TranscriptionSegment per decoded segment
+        """
+        audio_path = Path(audio_path)
+        
+        if use_vad is None:
+            use_vad = self.use_vad
+        
+        samples = _read_pcm16_mono_wav(audio_path)
+        model = self._ensure_model_loaded()
+        segments_gen, _ = model.transcribe(
+            samples if samples is not None else str(audio_path),
+            language=language,
+            vad_filter=use_vad,
+            vad_parameters=DEFAULT_VAD_PARAMETERS if use_vad else None
+        )
+        
+        for segment in segments_gen:
+            yield TranscriptionSegment(text=segment.text, start=segment.start, end=segment.end)
+    
     def transcribe_batch(
         self,
         audio_paths: List[Union[str, Path]],
         language: str = "ru",
-        use_vad: bool = True
+        use_vad: Optional[bool] = None
     ) -> List[TranscriptionResult]:
         """
         Transcribe multiple audio files.
@@ -384,7 +608,7 @@ class FasterWhisperService:
         Args:
             audio_paths: List of audio file paths
             language: Language code
-            use_vad: Enable VAD filtering
+            use_vad: Enable VAD filtering (None = service default)
         
         Returns:
             List of TranscriptionResult objects
@@ -438,6 +662,202 @@ class FasterWhisperService:
             logger.info("Model unloaded, GPU memory freed")
 
 
+# ============================================================================
+# CROSS-REQUEST BATCHING
+# ============================================================================
+
+class TranscriptionBatcher:
+    """
+    Coalesces concurrent short transcriptions into one batched decode.
+    
+    BatchedInferencePipeline batches the 30 s windows of a single audio.
+    Requests arriving within BATCH_WINDOW_SEC of each other are decoded,
+    concatenated, and passed as one audio with one clip per request, so
+    the encoder runs once over all of them; segments are then mapped back
+    to their request by start time.
+    
+    Only short clips with a known language are batched, and only when the
+    service does not strip silence (the pipeline ignores VAD when given
+    clip_timestamps). Everything else is handed back to the caller, so a
+    long upload never holds up the shared worker thread.
+    
+    Usage:
+        batcher = get_transcription_batcher()
+        future = batcher.submit("audio.webm", language="ru")
+        result = future.result() if future else service.transcribe("audio.webm")
+    """
+    
+    def __init__(
+        self,
+        service: FasterWhisperService,
+        window_sec: float = BATCH_WINDOW_SEC,
+        max_batch_size: int = BATCH_MAX_REQUESTS,
+        max_audio_sec: float = BATCH_MAX_AUDIO_SEC
+    ):
+        """
+        Args:
+            service: Service whose model and batch size are used
+            window_sec: Coalescing window after the first queued request
+            max_batch_size: Maximum requests per batch
+            max_audio_sec: Maximum total audio per encoder batch
+        """
+        self.service = service
+        self.window_sec = window_sec
+        self.max_batch_size = max_batch_size
+        self.max_audio_sec = max_audio_sec
+        
+        self._queue: Optional["queue.Queue[tuple]"] = None
+        self._worker_pid: Optional[int] = None
+        self._lock = threading.Lock()
+    
+    def _ensure_worker(self) -> "queue.Queue[tuple]":
+        """Start the worker thread in this process (threads do not survive fork)."""
+        with self._lock:
+            if self._worker_pid != os.getpid():
+                self._queue = queue.Queue()
+                threading.Thread(
+                    target=self._run, args=(self._queue,), name="whisper-batcher", daemon=True
+                ).start()
+                self._worker_pid = os.getpid()
+            return self._queue
+    
+    def submit(self, audio_path: Union[str, Path], language: str = "ru") -> Optional["Future[TranscriptionResult]"]:
+        """
+        Decode an audio file on the calling thread and queue it for batching.
+        
+        Returns:
+            Future resolving to its TranscriptionResult, or None when the
+            request cannot be batched: VAD enabled on the service, no
+            language (auto-detect), audio longer than BATCH_MAX_CLIP_SEC,
+            empty or undecodable. The caller then transcribes it itself.
+        """
+        if language is None or self.service.use_vad:
+            return None
+        
+        try:
+            audio = _read_pcm16_mono_wav(Path(audio_path))
+            if audio is None:
+                audio = decode_audio(str(audio_path), sampling_rate=SAMPLE_RATE)
+        except Exception as e:
+            logger.warning(f"Not batching {audio_path}: could not decode audio: {e}")
+            return None
+        
+        duration = audio.shape[0] / SAMPLE_RATE
+        if duration == 0 or duration > BATCH_MAX_CLIP_SEC:
+            # Long audio needs VAD windowing and its own decode
+            return None
+        
+        future: Future = Future()
+        self._ensure_worker().put((audio, language, future))
+        return future
+    
+    def _run(self, requests: "queue.Queue[tuple]"):
+        """Worker loop: collect a window of requests, then process them."""
+        while True:
+            batch = [requests.get()]
+            deadline = time.monotonic() + self.window_sec
+            
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(requests.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            try:
+                self._process(batch)
+            except Exception as e:
+                # Never leave a caller waiting on a crashed batch
+                logger.error(f"Batched transcription failed: {e}")
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_result(TranscriptionResult(error=str(e)))
+    
+    def _process(self, batch: List[tuple]):
+        """Group the batch's clips by language and decode each group."""
+        groups: Dict[str, List[tuple]] = {}
+        
+        for audio, language, future in batch:
+            if future.set_running_or_notify_cancel():
+                groups.setdefault(language, []).append((audio, future))
+        
+        for language, clips in groups.items():
+            # Split on the audio cap so one batch cannot exhaust VRAM
+            chunk, chunk_sec = [], 0.0
+            for audio, future in clips:
+                clip_sec = audio.shape[0] / SAMPLE_RATE
+                if chunk and chunk_sec + clip_sec > self.max_audio_sec:
+                    self._transcribe_clips(language, chunk)
+                    chunk, chunk_sec = [], 0.0
+                chunk.append((audio, future))
+                chunk_sec += clip_sec
+            self._transcribe_clips(language, chunk)
+    
+    def _transcribe_clips(self, language: str, clips: List[tuple]):
+        """Run one batched decode over several clips and resolve their futures."""
+        start_time = time.time()
+        
+        offsets = []  # Clip start times (seconds) within the concatenated audio
+        position = 0
+        for audio, _ in clips:
+            offsets.append(position / SAMPLE_RATE)
+            position += audio.shape[0]
+        
+        clip_timestamps = [
+            {"start": offset, "end": offset + audio.shape[0] / SAMPLE_RATE}
+            for offset, (audio, _) in zip(offsets, clips)
+        ]
+        
+        try:
+            pipeline = self.service._ensure_batched_pipeline()
+            segments_gen, _ = pipeline.transcribe(
+                np.concatenate([audio for audio, _ in clips]),
+                batch_size=self.service.batch_size,
+                language=language,
+                clip_timestamps=clip_timestamps
+            )
+            
+            per_clip: List[List[TranscriptionSegment]] = [[] for _ in clips]
+            for segment in segments_gen:
+                # Timestamps are rounded to ms; the slack keeps a segment at
+                # its clip's very start from landing in the previous clip
+                index = max(bisect_right(offsets, segment.start + 0.01) - 1, 0)
+                offset = offsets[index]
+                per_clip[index].append(TranscriptionSegment(
+                    text=segment.text,
+                    start=max(segment.start - offset, 0.0),
+                    end=max(segment.end - offset, 0.0)
+                ))
+        except Exception as e:
+            process_time = time.time() - start_time
+            logger.error(f"Batched transcription failed: {e}")
+            for audio, future in clips:
+                future.set_result(TranscriptionResult(
+                    error=str(e),
+                    duration_audio_sec=audio.shape[0] / SAMPLE_RATE,
+                    duration_process_sec=process_time
+                ))
+            return
+        
+        process_time = time.time() - start_time
+        logger.info(f"Batched transcription of {len(clips)} clips", {
+            "audio_sec": position / SAMPLE_RATE,
+            "process_sec": process_time
+        })
+        
+        for (audio, future), segments in zip(clips, per_clip):
+            future.set_result(TranscriptionResult(
+                text="".join(seg.text for seg in segments).strip(),
+                language=language,
+                duration_audio_sec=audio.shape[0] / SAMPLE_RATE,
+                duration_process_sec=process_time,
+                segments=segments,
+                raw_info={"batched_with": len(clips)}
+            ))
+
+
 # ============================================================================
 # SINGLETON INSTANCE
 # ============================================================================
@@ -445,14 +865,55 @@ class FasterWhisperService:
 # Create default instance (lazy loaded)
 _faster_whisper_service: Optional[FasterWhisperService] = None
 
-def get_faster_whisper_service() -> FasterWhisperService:
-    """Get or create the singleton FasterWhisperService instance."""
+_transcription_batcher: Optional[TranscriptionBatcher] = None
+
+def get_faster_whisper_service(
+    device: str = DEFAULT_DEVICE,
+    compute_type: str = DEFAULT_COMPUTE_TYPE,
+    use_vad: bool = DEFAULT_VAD_FILTER,
+    cpu_threads: int = DEFAULT_CPU_THREADS,
+    num_workers: int = 1
+) -> FasterWhisperService:
+    """
+    Get or create the singleton FasterWhisperService instance.
+
+    The arguments only apply when the singleton is first created.
+    """
     global _faster_whisper_service
     if _faster_whisper_service is None:
-        _faster_whisper_service = FasterWhisperService()
+        _faster_whisper_service = FasterWhisperService(
+            device=device,
+            compute_type=compute_type,
+            use_vad=use_vad,
+            cpu_threads=cpu_threads,
+            num_workers=num_workers
+        )
+        # Only an explicit CPU device is loaded here: this may run in a
+        # pre-fork master (gunicorn --preload), where resolving "auto" or
+        # loading a GPU model would initialize CUDA, which a forked worker
+        # can never use again
+        if WHISPER_PRELOAD and device == "cpu":
+            _faster_whisper_service._ensure_model_loaded()
+        
+        if WHISPER_WARMUP and device == "cpu":
+            try:
+                _faster_whisper_service.warmup()
+            except Exception as e:
+                logger.warning(f"Whisper warm-up failed: {e}")
+        elif WHISPER_WARMUP:
+            # Warm up on first load, in the process that serves requests
+            _faster_whisper_service._warmup_on_load = True
     return _faster_whisper_service
 
 
+def get_transcription_batcher() -> TranscriptionBatcher:
+    """Get or create the singleton TranscriptionBatcher over the shared service."""
+    global _transcription_batcher
+    if _transcription_batcher is None:
+        _transcription_batcher = TranscriptionBatcher(get_faster_whisper_service())
+    return _transcription_batcher
+
+
 # ============================================================================
 # CONVENIENCE FUNCTIONS (Compatible with voice_whisper.py API)
 # ============================================================================
@@ -5,17 +5,42 @@ Isolated utilities for docs/automation scripts.
 Independent from main project's utils/ directory.
 """
 
+import importlib
+
 from .docs_logger import DocsLogger, get_logger
 from .docs_config import DocsConfig, docs_config, get_config
-from .docs_llm_backend import DocsLLMBackend, get_backend, generate
-from .docs_dual_memory import (
-    DocsDualMemory, 
-    DocsDualMemoryIndex,
-    ContentChunk,
-    SearchResult,
-    unified_search,
-    build_dual_memory
-)
+
+# The heavy submodules are imported on first attribute access (PEP 562), so
+# importing a lightweight helper (e.g. utils.docs_logger) doesn't also pull
+# in the LLM backend's HTTP stack and the dual-memory index.
+_LAZY_EXPORTS = {
+    # LLM Backend
+    'DocsLLMBackend': 'docs_llm_backend',
+    'get_backend': 'docs_llm_backend',
+    'generate': 'docs_llm_backend',
+    
+    # Dual Memory
+    'DocsDualMemory': 'docs_dual_memory',
+    'DocsDualMemoryIndex': 'docs_dual_memory',
+    'ContentChunk': 'docs_dual_memory',
+    'SearchResult': 'docs_dual_memory',
+    'unified_search': 'docs_dual_memory',
+    'build_dual_memory': 'docs_dual_memory',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Logger
@@ -481,34 +481,55 @@ class DocsDualMemory:
         """Initialize dual memory."""
         self.index = DocsDualMemoryIndex()
     
-    def search_descriptions(self, query: str, top_k: int = 10) -> List[SearchResult]:
+    def embed_query(self, query: str) -> List[float]:
+        """Embed a search query (one embedding request)."""
+        return self.index.embedder.generate([query])[0]
+    
+    def embed_texts(self, texts: List[str], batch_size: int = 64) -> List[List[float]]:
+        """Embed many texts, batch_size texts per generate() call."""
+        embeddings = []
+        for start in range(0, len(texts), batch_size):
+            embeddings.extend(self.index.embedder.generate(texts[start:start + batch_size]))
+        return embeddings
+    
+    def search_descriptions(self, query: str, top_k: int = 10,
+                            query_embedding: Optional[List[float]] = None) -> List[SearchResult]:
         """Search description index."""
         index_data = self.index._load_index("description")
-        return self._search_index(query, index_data, "description", top_k)
+        return self._search_index(query, index_data, "description", top_k, query_embedding)
     
-    def search_code(self, query: str, top_k: int = 10) -> List[SearchResult]:
+    def search_code(self, query: str, top_k: int = 10,
+                    query_embedding: Optional[List[float]] = None) -> List[SearchResult]:
         """Search code index."""
         index_data = self.index._load_index("code")
-        return self._search_index(query, index_data, "code", top_k)
+        return self._search_index(query, index_data, "code", top_k, query_embedding)
     
-    def unified_search(self, query: str, top_k: int = 10) -> List[SearchResult]:
-        """Search both indexes."""
-        desc = self.search_descriptions(query, top_k)
-        code = self.search_code(query, top_k)
+    def unified_search(self, query: str, top_k: int = 10,
+                       query_embedding: Optional[List[float]] = None) -> List[SearchResult]:
+        """
+        Search both indexes.
+        
+        Pass query_embedding (see embed_query) when the caller already has
+        it; otherwise each index embeds the query itself.
+        """
+        desc = self.search_descriptions(query, top_k, query_embedding)
+        code = self.search_code(query, top_k, query_embedding)
         
         all_results = desc + code
         all_results.sort(key=lambda r: r.score, reverse=True)
         return all_results[:top_k]
     
     def _search_index(self, query: str, index_data: Dict, 
-                      content_type: str, top_k: int) -> List[SearchResult]:
+                      content_type: str, top_k: int,
+                      query_embedding: Optional[List[float]] = None) -> List[SearchResult]:
         """Search single index."""
         results = []
         
         if not index_data.get("chunks"):
             return results
         
-        query_embedding = self.index.embedder.generate([query])[0]
+        if query_embedding is None:
+            query_embedding = self.embed_query(query)
         chunks = index_data["chunks"]
         embeddings = index_data["embeddings"]
         
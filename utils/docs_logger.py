@@ -16,7 +16,10 @@ DOCUMENTATION:
 """
 
 import os
+import atexit
 import logging
+import logging.handlers
+import queue
 import threading
 import hashlib
 import json
@@ -63,6 +66,10 @@ class DocsLogger:
         self.logger = logging.getLogger(f"docs_{script_name}_{os.getpid()}")
         self.logger.setLevel(logging.DEBUG)
         
+        # Set by use_background_thread()
+        self._handlers = None
+        self._listener = None
+        
         # Prevent duplicate handlers
         if self.logger.handlers:
             return
@@ -88,6 +95,55 @@ class DocsLogger:
         # Don't propagate to root logger
         self.logger.propagate = False
 
+    def use_background_thread(self):
+        """
+        Move formatting and file I/O to a background thread.
+        
+        The logger's handlers are replaced by a QueueHandler; a
+        QueueListener thread drains the queue into the original handlers.
+        Logging calls then only enqueue a record, so request-serving
+        threads never block on disk flushes. Idempotent; the listener is
+        restarted in forked children (threads do not survive fork) and
+        stopped (flushing the queue) at exit.
+        """
+        with self._lock:
+            if self._handlers is not None:
+                return
+            self._handlers = list(self.logger.handlers)
+            self._start_listener()
+            os.register_at_fork(
+                before=self._acquire_handlers,
+                after_in_parent=self._release_handlers,
+                # logging re-creates handler locks in the child itself
+                after_in_child=self._start_listener
+            )
+            atexit.register(self._stop_listener)
+
+    def _acquire_handlers(self):
+        """Keep the listener from forking mid-write (file buffer locks)."""
+        for handler in self._handlers:
+            handler.acquire()
+
+    def _release_handlers(self):
+        """Undo _acquire_handlers() in the parent after fork."""
+        for handler in reversed(self._handlers):
+            handler.release()
+
+    def _start_listener(self):
+        """Route records through a fresh queue to the original handlers."""
+        log_queue = queue.SimpleQueue()
+        self.logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+        self._listener = logging.handlers.QueueListener(
+            log_queue, *self._handlers, respect_handler_level=True
+        )
+        self._listener.start()
+
+    def _stop_listener(self):
+        """Write out queued records and stop the listener thread."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
     def log(self, message: str, level: str = "INFO", context: Optional[Dict[str, Any]] = None):
         """Log message with optional context."""
         if context: